@@ -0,0 +1,46 @@
+import sys
+import time
+
+from pycps_sysmlv2 import SysMLArchitecture, SysMLPartDefinition, SysMLPartReference, SysMLType
+from pycps_sysmlv2.parser_utils import to_jsonable
+from pycps_sysmlv2.traversal import iter_part_instances, walk_model, walk_parts
+
+
+def build_chain(depth: int) -> SysMLArchitecture:
+    """A part hierarchy `depth` levels deep: Level0 contains Level1 contains ..."""
+    part_defs = {}
+    child = None
+    for level in reversed(range(depth)):
+        parts = {}
+        if child is not None:
+            parts["child"] = SysMLPartReference("child", child.name, part_def=child)
+        child = SysMLPartDefinition(f"Level{level}", parts=parts)
+        part_defs[child.name] = child
+    return SysMLArchitecture(package="Deep", part_definitions=part_defs)
+
+
+def timed(label: str, func) -> None:
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:8.3f} s  ({result})")
+
+
+def main() -> None:
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(f"depth={depth} (recursion limit {sys.getrecursionlimit()})")
+    architecture = build_chain(depth)
+    root = architecture.part_definitions["Level0"]
+
+    timed("walk_parts (post-order)", lambda: sum(1 for _ in walk_parts(root, "post")))
+    timed("walk_model", lambda: sum(1 for _ in walk_model(architecture)))
+    timed("iter_part_instances", lambda: max(len(path) for path, _ in iter_part_instances(root)))
+    timed("to_jsonable", lambda: len(to_jsonable(architecture, [])["part_definitions"]))
+
+    nested = 1.0
+    for _ in range(depth):
+        nested = [nested]
+    timed("SysMLType.from_value", lambda: len(SysMLType.from_value(nested).as_string()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,74 @@
-"""Standalone SysML utilities package for architecture parsing and generation tooling."""
+"""Standalone SysML utilities package for architecture parsing and generation tooling.
+
+Public names are resolved lazily on first attribute access (PEP 562), so importing the
+package does not import the parser, the model dataclasses or `json` until they are used.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
 
 __version__ = "0.1.0"
 
-from .parsing import (
-    SysMLArchitecture,
-    SysMLAttribute,
-    SysMLConnection,
-    SysMLFolderParser,
-    SysMLPartDefinition,
-    SysMLPartReference,
-    SysMLPortDefinition,
-    SysMLPortReference,
-    SysMLRequirement,
-    SysMLType,
-    load_architecture,
-    load_system,
-)
-
-
-from .parser_utils import json_dumps
\ No newline at end of file
+# Avoids importing `typing` at package import time; type checkers treat it as True.
+TYPE_CHECKING = False
+
+_EXPORTS: dict[str, str] = {
+    "SysMLArchitecture": "definitions",
+    "SysMLAttribute": "definitions",
+    "SysMLConnection": "definitions",
+    "SysMLPartDefinition": "definitions",
+    "SysMLPartReference": "definitions",
+    "SysMLPortDefinition": "definitions",
+    "SysMLPortReference": "definitions",
+    "SysMLRequirement": "definitions",
+    "SysMLType": "definitions",
+    "SysMLFolderParser": "parsing",
+    "load_architecture": "parsing",
+    "load_system": "parsing",
+    "SysMLQuery": "query",
+    "compile_query": "query",
+    "ConnectionChecker": "validation",
+    "SysMLConnectionIssue": "validation",
+    "port_signature": "validation",
+    "validate_connections": "validation",
+    "json_dumps": "parser_utils",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .definitions import (
+        SysMLArchitecture,
+        SysMLAttribute,
+        SysMLConnection,
+        SysMLPartDefinition,
+        SysMLPartReference,
+        SysMLPortDefinition,
+        SysMLPortReference,
+        SysMLRequirement,
+        SysMLType,
+    )
+    from .parser_utils import json_dumps
+    from .parsing import SysMLFolderParser, load_architecture, load_system
+    from .query import SysMLQuery, compile_query
+    from .validation import (
+        ConnectionChecker,
+        SysMLConnectionIssue,
+        port_signature,
+        validate_connections,
+    )
@@ -0,0 +1,295 @@
+"""Caching of parsed architectures keyed by a stat-based folder fingerprint.
+
+- `ArchitectureDiskCache` pickles parse results across processes (used by the CLI).
+- `ArchitectureMemoryCache` is the bounded in-process LRU behind
+  `load_architecture(..., cache=True)`; configure it with `configure_cache`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Hashable, List, Optional, Tuple, Union
+
+from . import __version__
+from .definitions import SysMLArchitecture
+from .discovery import Patterns, scan_root
+
+# Bumped when the pickled model layout changes, so older entries are re-parsed.
+_CACHE_FORMAT = 2
+
+# (file name, size in bytes, modification time in ns) per `.sysml` file.
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+def folder_fingerprint(
+    folder: Path | str,
+    recursive: bool = False,
+    include: Patterns = None,
+    exclude: Patterns = None,
+) -> Fingerprint:
+    """Return a cheap fingerprint of the `.sysml` files the parser would read.
+
+    Names are relative to `folder` (``/``-separated); discovery options match
+    `load_architecture`.
+    """
+    return tuple(
+        (relative, stat.st_size, stat.st_mtime_ns)
+        for relative, stat in scan_root(
+            Path(folder), recursive, include, exclude, with_stat=True
+        )
+    )
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pycps_sysmlv2"
+
+
+class ArchitectureDiskCache:
+    """Pickle parsed architectures under `directory`, one file per source folder.
+
+    Entries are invalidated when the folder fingerprint, the package version or the
+    cache format changes.
+    """
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory)
+
+    def _entry_path(self, folder: Path) -> Path:
+        key = hashlib.sha1(str(folder.resolve()).encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.pickle"
+
+    def load(
+        self, folder: Path | str, fingerprint: Optional[Fingerprint] = None
+    ) -> Optional[SysMLArchitecture]:
+        folder = Path(folder)
+        entry = self._entry_path(folder)
+        if not entry.is_file():
+            return None
+        if fingerprint is None:
+            fingerprint = folder_fingerprint(folder)
+        try:
+            with entry.open("rb") as handle:
+                version, stored_fingerprint, architecture = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, AttributeError):
+            return None
+        if version != (__version__, _CACHE_FORMAT) or stored_fingerprint != fingerprint:
+            return None
+        return architecture
+
+    def store(
+        self,
+        folder: Path | str,
+        architecture: SysMLArchitecture,
+        fingerprint: Optional[Fingerprint] = None,
+    ) -> None:
+        folder = Path(folder)
+        if fingerprint is None:
+            fingerprint = folder_fingerprint(folder)
+        # Persist derived indexes with the parse result so loads come back ready.
+        architecture.requirement_index()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = self._entry_path(folder)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as handle:
+            pickle.dump(
+                ((__version__, _CACHE_FORMAT), fingerprint, architecture),
+                handle,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, entry)
+
+
+def load_architecture_cached(
+    folder: Path | str, cache_dir: Path | str
+) -> Tuple[SysMLArchitecture, bool]:
+    """Load `folder` through the disk cache. Returns the architecture and a hit flag."""
+    from .parsing import load_architecture
+
+    path = Path(folder)
+    if path.is_file():
+        path = path.parent
+    cache = ArchitectureDiskCache(cache_dir)
+    fingerprint = folder_fingerprint(path)
+    architecture = cache.load(path, fingerprint)
+    if architecture is not None:
+        return architecture, True
+    architecture = load_architecture(path)
+    try:
+        cache.store(path, architecture, fingerprint)
+    except OSError:
+        # The cache only saves time; an unwritable cache directory must not fail a load.
+        pass
+    return architecture, False
+
+
+class _Keep:
+    """Default for limits that a `resize` call leaves unchanged."""
+
+
+_KEEP = _Keep()
+
+
+@dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+    bytes: int
+    max_bytes: Optional[int]
+
+
+class ArchitectureMemoryCache:
+    """Thread-safe LRU of parsed architectures keyed by resolved roots and load options.
+
+    An entry is reused while the folder fingerprint is unchanged. Entry size is
+    estimated from the total size of its source files; entries are evicted when
+    either `maxsize` entries or `max_bytes` source bytes would be exceeded.
+    Hits return the cached graph itself, which callers must treat as read-only.
+    """
+
+    def __init__(self, maxsize: int = 32, max_bytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, Tuple[Fingerprint, SysMLArchitecture, int]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, fingerprint: Fingerprint) -> Optional[SysMLArchitecture]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(
+        self, key: Hashable, fingerprint: Fingerprint, architecture: SysMLArchitecture
+    ) -> None:
+        size = sum(entry[1] for entry in fingerprint)
+        with self._lock:
+            self._discard(key)
+            if self.maxsize <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+                return
+            self._entries[key] = (fingerprint, architecture, size)
+            self._bytes += size
+            self._shrink()
+
+    def resize(
+        self, maxsize: Optional[int] = None, max_bytes: Union[int, None, _Keep] = _KEEP
+    ) -> None:
+        """Change the limits that are passed; ``max_bytes=None`` removes the budget."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if not isinstance(max_bytes, _Keep):
+                self.max_bytes = max_bytes
+            self._shrink()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                currsize=len(self._entries),
+                maxsize=self.maxsize,
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _shrink(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.maxsize
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+
+_memory_cache = ArchitectureMemoryCache()
+
+
+def memory_cache() -> ArchitectureMemoryCache:
+    """Return the process-wide cache used by `load_architecture(..., cache=True)`."""
+    return _memory_cache
+
+
+def configure_cache(
+    maxsize: Optional[int] = None, max_bytes: Union[int, None, _Keep] = _KEEP
+) -> None:
+    """Set the in-process cache limits; shrinking evicts least recently used entries.
+
+    Limits that are not passed keep their current value (initially 32 entries and no
+    memory budget); pass ``max_bytes=None`` to remove a budget.
+    """
+    _memory_cache.resize(maxsize, max_bytes)
+
+
+def cache_info() -> CacheInfo:
+    return _memory_cache.info()
+
+
+def clear_cache() -> None:
+    _memory_cache.clear()
+
+
+def _patterns_key(patterns: Patterns) -> Optional[Tuple[str, ...]]:
+    if patterns is None:
+        return None
+    return (patterns,) if isinstance(patterns, str) else tuple(patterns)
+
+
+def load_architecture_memoized(
+    roots: List[Path],
+    recursive: bool = False,
+    include: Patterns = None,
+    exclude: Patterns = None,
+) -> SysMLArchitecture:
+    from .parsing import SysMLFolderParser
+
+    include = _patterns_key(include)
+    exclude = _patterns_key(exclude)
+    resolved = tuple(root.resolve() for root in roots)
+    key = (resolved, recursive, include, exclude)
+    # Names are prefixed with the root index so that equal relative paths under
+    # different roots stay distinct.
+    fingerprint = tuple(
+        (f"{index}:{name}", size, mtime)
+        for index, root in enumerate(resolved)
+        for name, size, mtime in folder_fingerprint(root, recursive, include, exclude)
+    )
+    architecture = _memory_cache.get(key, fingerprint)
+    if architecture is None:
+        architecture = SysMLFolderParser(
+            resolved, recursive=recursive, include=include, exclude=exclude
+        ).parse()
+        _memory_cache.put(key, fingerprint, architecture)
+    return architecture
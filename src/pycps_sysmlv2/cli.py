@@ -0,0 +1,231 @@
+"""Command-line interface: `pycps-sysmlv2 {parse,validate,stats,export,bench} FOLDER...`.
+
+Parser modules are imported inside the task functions so that `--help` and argument
+errors stay fast, and so worker processes only pay for what they use.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def _load(folder: str, options: Dict[str, Any]):
+    cache_dir = options.get("cache_dir")
+    if cache_dir is None:
+        from .parsing import load_architecture
+
+        return load_architecture(folder), False
+
+    from .cache import load_architecture_cached
+
+    return load_architecture_cached(folder, cache_dir)
+
+
+def _task_parse(folder: str, options: Dict[str, Any]) -> Tuple[int, List[str]]:
+    architecture, cached = _load(folder, options)
+    return 0, [
+        f"package={architecture.package} parts={len(architecture.part_definitions)} "
+        f"ports={len(architecture.port_definitions)} "
+        f"requirements={len(architecture.requirements)} cached={'yes' if cached else 'no'}"
+    ]
+
+
+def _task_validate(folder: str, options: Dict[str, Any]) -> Tuple[int, List[str]]:
+    from .validation import validate_connections
+
+    architecture, _ = _load(folder, options)
+    issues = validate_connections(architecture)
+    if not issues:
+        return 0, ["ok"]
+    return 1, [f"{len(issues)} issue(s)"] + [f"  {issue}" for issue in issues]
+
+
+def _task_stats(folder: str, options: Dict[str, Any]) -> Tuple[int, List[str]]:
+    architecture, _ = _load(folder, options)
+    parts = architecture.part_definitions.values()
+    stats = {
+        "part_definitions": len(architecture.part_definitions),
+        "port_definitions": len(architecture.port_definitions),
+        "requirements": len(architecture.requirements),
+        "subparts": sum(len(part.parts) for part in parts),
+        "ports": sum(len(part.ports) for part in parts),
+        "connections": sum(len(part.connections) for part in parts),
+        "part_attributes": sum(len(part.attributes) for part in parts),
+        "port_attributes": sum(
+            len(port.attributes) for port in architecture.port_definitions.values()
+        ),
+    }
+    return 0, [" ".join(f"{key}={value}" for key, value in stats.items())]
+
+
+def _task_export(folder: str, options: Dict[str, Any]) -> Tuple[int, List[str]]:
+    architecture, _ = _load(folder, options)
+    fmt = options["format"]
+    output = Path(options["output"])
+    output.mkdir(parents=True, exist_ok=True)
+    if fmt == "json":
+        from .parser_utils import json_dumps
+
+        target = output / f"{options['name']}.json"
+        target.write_text(json_dumps(architecture, []))
+    else:
+        import pickle
+
+        target = output / f"{options['name']}.pickle"
+        with target.open("wb") as handle:
+            pickle.dump(architecture, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    return 0, [f"wrote {target}"]
+
+
+def _export_names(folders: Sequence[str]) -> List[str]:
+    """Output file stems for `export`: the model folder's name, unique per argument.
+
+    Folders are resolved first (so `.` and files within a folder name that folder);
+    repeated names get a ``-2``, ``-3``, ... suffix instead of overwriting each other.
+    """
+    names: List[str] = []
+    taken = set()
+    for folder in folders:
+        path = Path(folder).resolve()
+        if path.is_file():
+            path = path.parent
+        base = path.name or "root"
+        name, index = base, 1
+        while name in taken:
+            index += 1
+            name = f"{base}-{index}"
+        taken.add(name)
+        names.append(name)
+    return names
+
+
+def _task_bench(folder: str, options: Dict[str, Any]) -> Tuple[int, List[str]]:
+    from .parsing import load_architecture
+
+    timings = []
+    for _ in range(options["repeat"]):
+        start = time.perf_counter()
+        load_architecture(folder)
+        timings.append(time.perf_counter() - start)
+    mean = sum(timings) / len(timings)
+    return 0, [
+        f"runs={len(timings)} min={min(timings) * 1e3:.2f}ms "
+        f"mean={mean * 1e3:.2f}ms max={max(timings) * 1e3:.2f}ms"
+    ]
+
+
+_TASKS: Dict[str, Callable[[str, Dict[str, Any]], Tuple[int, List[str]]]] = {
+    "parse": _task_parse,
+    "validate": _task_validate,
+    "stats": _task_stats,
+    "export": _task_export,
+    "bench": _task_bench,
+}
+
+
+def _run_task(command: str, folder: str, options: Dict[str, Any]):
+    """Run one command for one folder; executed in worker processes when parallel."""
+    start = time.perf_counter()
+    try:
+        status, lines = _TASKS[command](folder, options)
+    except (OSError, KeyError, ValueError) as exc:
+        status, lines = 1, [f"error: {exc}"]
+    return folder, status, lines, time.perf_counter() - start
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pycps-sysmlv2",
+        description="Parse, validate and export folders of SysML v2 files.",
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("folders", nargs="+", help="SysML folders (or files within them)")
+    common.add_argument(
+        "-j", "--jobs", type=int, default=1, help="parse folders in N worker processes"
+    )
+    common.add_argument(
+        "--cache-dir", type=Path, default=None, help="on-disk parse cache location"
+    )
+    common.add_argument("--no-cache", action="store_true", help="disable the parse cache")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("parse", parents=[common], help="parse and summarize folders")
+    commands.add_parser(
+        "validate", parents=[common], help="check connection directions and payload types"
+    )
+    commands.add_parser("stats", parents=[common], help="print element counts")
+    export = commands.add_parser("export", parents=[common], help="export parsed models")
+    export.add_argument("--format", choices=("json", "binary"), default="json")
+    export.add_argument(
+        "-o", "--output", type=Path, default=Path("."), help="output directory"
+    )
+    bench = commands.add_parser(
+        "bench", parents=[common], help="time repeated uncached parses"
+    )
+    bench.add_argument("--repeat", type=int, default=5)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.jobs < 1:
+        args.jobs = 1
+
+    cache_dir = None
+    if not args.no_cache and args.command != "bench":
+        if args.cache_dir is None:
+            from .cache import default_cache_dir
+
+            cache_dir = default_cache_dir()
+        else:
+            cache_dir = args.cache_dir
+
+    options: Dict[str, Any] = {"cache_dir": cache_dir}
+    if args.command == "export":
+        options.update(format=args.format, output=str(args.output))
+    if args.command == "bench":
+        options.update(repeat=max(1, args.repeat))
+    task_options = [options] * len(args.folders)
+    if args.command == "export":
+        task_options = [dict(options, name=name) for name in _export_names(args.folders)]
+
+    start = time.perf_counter()
+    if args.jobs > 1 and len(args.folders) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(
+                pool.map(
+                    _run_task,
+                    [args.command] * len(args.folders),
+                    args.folders,
+                    task_options,
+                )
+            )
+    else:
+        results = [
+            _run_task(args.command, folder, folder_options)
+            for folder, folder_options in zip(args.folders, task_options)
+        ]
+
+    exit_code = 0
+    for folder, status, lines, elapsed in results:
+        exit_code = max(exit_code, status)
+        stream = sys.stderr if status and lines[0].startswith("error:") else sys.stdout
+        print(f"{folder}: {lines[0]} ({elapsed * 1e3:.1f} ms)", file=stream)
+        for line in lines[1:]:
+            print(line, file=stream)
+    total = time.perf_counter() - start
+    print(
+        f"{len(results)} folder(s) in {total * 1e3:.1f} ms with {args.jobs} job(s)",
+        file=sys.stderr,
+    )
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,9 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
 from .parser_utils import json_dumps
+from .traversal import unwrap_first, walk_parts
 from .utils import obj_base
 
-import ast
 #  Definitions
 
 
@@ -61,14 +61,14 @@ class SysMLType:
 
     @staticmethod
     def _as_string(type):
+        depth, type = unwrap_first(type)
         if isinstance(type, (list, tuple)):
-            if len(type) == 0:
-                return "List[]"
-            else:
-                return f"List[{SysMLType._as_string(type[0])}]"
-        if isinstance(type, Enum):
-            return str(type.value)
-        return str(type)
+            name = "List[]"
+        elif isinstance(type, Enum):
+            name = str(type.value)
+        else:
+            name = str(type)
+        return "List[" * depth + name + "]" * depth
 
     @staticmethod
     def from_value(value):
@@ -76,21 +76,25 @@ class SysMLType:
 
     @staticmethod
     def _from_value(value):
+        # Lists are typed by their first element: [[1]] -> [[Integer]].
+        depth, value = unwrap_first(value)
         if value is None:
-            return PrimitiveType.Null
-        if isinstance(value, bool):
-            return PrimitiveType.Boolean
-        if isinstance(value, int):
-            return PrimitiveType.Integer
-        if isinstance(value, float):
-            return PrimitiveType.Real
-        if isinstance(value, str):
-            return PrimitiveType.String
-        if isinstance(value, (list, tuple)):
-            if len(value) == 0:
-                return list()
-            else:
-                return [SysMLType._from_value(value[0])]
+            result = PrimitiveType.Null
+        elif isinstance(value, bool):
+            result = PrimitiveType.Boolean
+        elif isinstance(value, int):
+            result = PrimitiveType.Integer
+        elif isinstance(value, float):
+            result = PrimitiveType.Real
+        elif isinstance(value, str):
+            result = PrimitiveType.String
+        elif isinstance(value, (list, tuple)):
+            result = list()
+        else:
+            result = None
+        for _ in range(depth):
+            result = [result]
+        return result
 
     @staticmethod
     def from_string(string: str) -> "SysMLType":
@@ -145,6 +149,8 @@ class SysMLAttribute:
         if lowered in {"true", "false"}:
             return lowered == "true"
 
+        import ast
+
         try:
             return ast.literal_eval(text)
         except (ValueError, SyntaxError):
@@ -260,17 +266,112 @@ class SysMLArchitecture:
     port_definitions: Dict[str, SysMLPortDefinition] = field(default_factory=dict)
     part_definitions: Dict[str, SysMLPartDefinition] = field(default_factory=dict)
     requirements: List[SysMLRequirement] = field(default_factory=list)
+    # Requirement identifier -> enclosing part/port definition name, for requirements
+    # declared inside a definition. Underscored, so it is not part of the JSON export.
+    _requirement_scopes: Dict[str, str] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
         return json_dumps(self)
 
-    def __post_init__(self):
+    def slice(self, system_part: str | SysMLPartDefinition) -> SysMLArchitecture:
+        """Return a minimal architecture holding only what `system_part` depends on.
+
+        One pass over the part hierarchy collects the reachable part definitions and
+        the port definitions their ports use. Requirements scoped to a kept definition
+        and package-level requirements are kept. Definitions and requirements are
+        shared with this architecture, not copied, so the slice is cheap to build and
+        pickles to the size of the subsystem; treat both as read-only.
+        """
+        name = system_part if isinstance(system_part, str) else system_part.name
+        root = self.part_definitions.get(name)
+        if root is None or not (root is system_part or isinstance(system_part, str)):
+            raise KeyError(f"Part not found: {name}")
+
+        part_ids = set()
+        port_ids = set()
+        for part in walk_parts(root):
+            part_ids.add(id(part))
+            for port in part.ports.values():
+                if port.port_def is not None:
+                    port_ids.add(id(port.port_def))
+
+        part_defs = {
+            name: part
+            for name, part in self.part_definitions.items()
+            if id(part) in part_ids
+        }
+        port_defs = {
+            name: port_def
+            for name, port_def in self.port_definitions.items()
+            if id(port_def) in port_ids
+        }
+        scopes = self._requirement_scopes
+        kept = part_defs.keys() | port_defs.keys()
+        requirements = [
+            req
+            for req in self.requirements
+            if scopes.get(req.identifier) is None or scopes[req.identifier] in kept
+        ]
+        return SysMLArchitecture(
+            package=self.package,
+            port_definitions=port_defs,
+            part_definitions=part_defs,
+            requirements=requirements,
+            _requirement_scopes={
+                req.identifier: scopes[req.identifier]
+                for req in requirements
+                if req.identifier in scopes
+            },
+        )
 
-        # To ensure json export order
-        self.part_definitions = dict(
-            sorted(
-                self.part_definitions.items(),
-                key=lambda item: (len(item[1].parts), item[0]),
-                reverse=False,
-            )
+    def requirement_index(self, rebuild: bool = False):
+        """Return the lazily built `SysMLRequirementIndex` for `requirements`.
+
+        The index is cached on the instance (and pickled with it); pass `rebuild=True`
+        after replacing `requirements`, or update the returned index incrementally.
+        """
+        index = getattr(self, "_requirement_index", None)
+        if index is None or rebuild:
+            from .requirements import SysMLRequirementIndex
+
+            index = SysMLRequirementIndex.from_architecture(self)
+            self._requirement_index = index
+        return index
+
+    def query(self, expression: str):
+        """Lazily yield objects selected by a path query, see `pycps_sysmlv2.query`."""
+        from .query import compile_query
+
+        return compile_query(expression).execute(self)
+
+    def ordered_part_definitions(self) -> Dict[str, SysMLPartDefinition]:
+        """`part_definitions` sorted by (number of subparts, name): the JSON export order.
+
+        `part_definitions` itself keeps insertion order. The sorted view is computed on
+        demand and cached until a definition is added, removed, replaced or changes its
+        number of subparts.
+        """
+        key = tuple(
+            (name, id(part), len(part.parts)) for name, part in self.part_definitions.items()
         )
+        cached = getattr(self, "_ordered_parts", None)
+        if cached is None or cached[0] != key:
+            ordered = dict(
+                sorted(
+                    self.part_definitions.items(),
+                    key=lambda item: (len(item[1].parts), item[0]),
+                )
+            )
+            cached = self._ordered_parts = (key, ordered)
+        return cached[1]
+
+    def _export_items(self) -> List[Tuple[str, Any]]:
+        """Attributes for `to_jsonable`, with part definitions in export order."""
+        ordered = self.ordered_part_definitions()
+        return [
+            (key, ordered if key == "part_definitions" else value)
+            for key, value in vars(self).items()
+            if not key.startswith("_")
+        ]
@@ -0,0 +1,140 @@
+"""Find the `.sysml` files of one or more model roots.
+
+Directories are listed with `os.scandir`. Recursive walks list directories in a thread
+pool: `scandir` and `stat` release the GIL, so deep trees and network file systems are
+walked concurrently. Symlinked directories are not followed, which keeps walks finite.
+
+`include`/`exclude` take one glob pattern or several. A pattern matches when it matches
+the path relative to its root (``/``-separated) or the bare file/directory name, e.g.
+``include="vehicles/*"``, ``exclude="drafts"`` or ``exclude="*_old.sysml"``. Excluded
+directories are not descended into; `include` applies to files only.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from fnmatch import translate
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+PathLike = Union[Path, str]
+Roots = Union[PathLike, Sequence[PathLike]]
+Patterns = Union[str, Iterable[str], None]
+
+# (path relative to its root, stat result or None) per discovered file.
+_Found = Tuple[str, Optional[os.stat_result]]
+_Matcher = Callable[[str, str], bool]
+
+
+def as_roots(roots: Roots) -> List[Path]:
+    """Normalize one path or a sequence of paths; a file stands for its parent folder."""
+    if isinstance(roots, (str, os.PathLike)):
+        roots = [roots]
+    folders = []
+    for root in roots:
+        path = Path(root)
+        if path.is_file():
+            path = path.parent
+        if not path.is_dir():
+            raise FileNotFoundError(f"SysML folder not found: {path}")
+        folders.append(path)
+    if not folders:
+        raise FileNotFoundError("No SysML folders given")
+    return folders
+
+
+def _matcher(patterns: Patterns) -> Optional[_Matcher]:
+    if patterns is None:
+        return None
+    patterns = [patterns] if isinstance(patterns, str) else list(patterns)
+    if not patterns:
+        return None
+    regex = re.compile("|".join(f"(?:{translate(pattern)})" for pattern in patterns))
+    return lambda relative, name: bool(regex.match(relative) or regex.match(name))
+
+
+def _scan_directory(
+    directory: str,
+    prefix: str,
+    recursive: bool,
+    with_stat: bool,
+    include: Optional[_Matcher],
+    exclude: Optional[_Matcher],
+) -> Tuple[List[_Found], List[Tuple[str, str]]]:
+    files: List[_Found] = []
+    subdirs: List[Tuple[str, str]] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            relative = prefix + name
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and not (exclude and exclude(relative, name)):
+                    subdirs.append((entry.path, relative + "/"))
+            elif name.endswith(".sysml") and entry.is_file():
+                if include and not include(relative, name):
+                    continue
+                if exclude and exclude(relative, name):
+                    continue
+                files.append((relative, entry.stat() if with_stat else None))
+    return files, subdirs
+
+
+def scan_root(
+    root: Path,
+    recursive: bool = False,
+    include: Patterns = None,
+    exclude: Patterns = None,
+    with_stat: bool = False,
+    workers: Optional[int] = None,
+) -> List[_Found]:
+    """Return ``(relative path, stat or None)`` for each `.sysml` file, sorted by path."""
+    args = (recursive, with_stat, _matcher(include), _matcher(exclude))
+    found, subdirs = _scan_directory(str(root), "", *args)
+    if subdirs:
+        # Imported here: `concurrent.futures` pulls in `logging` and threading helpers.
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = {
+                pool.submit(_scan_directory, path, prefix, *args) for path, prefix in subdirs
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    found += files
+                    pending.update(
+                        pool.submit(_scan_directory, path, prefix, *args)
+                        for path, prefix in subdirs
+                    )
+    found.sort(key=lambda item: item[0].split("/"))
+    return found
+
+
+def discover_sysml_files(
+    roots: Roots,
+    recursive: bool = False,
+    include: Patterns = None,
+    exclude: Patterns = None,
+    workers: Optional[int] = None,
+) -> List[Path]:
+    """List the `.sysml` files under `roots` in a stable order (root order, then path).
+
+    Files reachable from several (overlapping) roots are listed once.
+    """
+    files: List[Path] = []
+    folders = as_roots(roots)
+    seen = set()
+    for root in folders:
+        # String joins: building Path objects dominates discovery time on large trees.
+        prefix = os.path.join(str(root), "")
+        resolved = os.path.join(str(root.resolve()), "")
+        for relative, _ in scan_root(root, recursive, include, exclude, workers=workers):
+            if len(folders) > 1:
+                key = resolved + relative
+                if key in seen:
+                    continue
+                seen.add(key)
+            files.append(Path(prefix + relative))
+    return files
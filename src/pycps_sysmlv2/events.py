@@ -0,0 +1,335 @@
+"""Event-driven (SAX-style) scanning of `.sysml` files.
+
+`iter_events(folder)` reads each file in fixed-size chunks and yields one `SysMLEvent`
+per package/definition boundary and per member statement, so memory use is bounded by
+the largest single statement or comment rather than by the model size.
+
+`build_architecture(events)` is an optional consumer that links the event stream into
+the same `SysMLArchitecture` that `load_architecture` returns.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .definitions import (
+    SysMLArchitecture,
+    SysMLPartDefinition,
+    SysMLPortDefinition,
+    SysMLRequirement,
+)
+from .parser_utils import whitespace_re
+from .parsing import (
+    _link_definitions,
+    _parse_attribute,
+    _parse_connection,
+    _parse_part_reference,
+    _parse_port_endpoint,
+)
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class SysMLEventKind(str, Enum):
+    START_PACKAGE = "start_package"
+    END_PACKAGE = "end_package"
+    START_PART_DEF = "start_part_def"
+    END_PART_DEF = "end_part_def"
+    START_PORT_DEF = "start_port_def"
+    END_PORT_DEF = "end_port_def"
+    DOC = "doc"  # documentation of the enclosing definition
+    ATTRIBUTE = "attribute"
+    PORT = "port"
+    PART = "part"
+    CONNECTION = "connection"
+    REQUIREMENT = "requirement"
+
+
+@dataclass
+class SysMLEvent:
+    kind: SysMLEventKind
+    path: Path
+    name: Optional[str] = None  # package/definition name for start, end and doc events
+    element: Any = None  # parsed model object for member and requirement events
+    scope: Optional[str] = None  # enclosing definition name, None at package level
+
+
+_BLOCK_KINDS = {
+    "package": (SysMLEventKind.START_PACKAGE, SysMLEventKind.END_PACKAGE),
+    "part def": (SysMLEventKind.START_PART_DEF, SysMLEventKind.END_PART_DEF),
+    "port def": (SysMLEventKind.START_PORT_DEF, SysMLEventKind.END_PORT_DEF),
+}
+
+
+@lru_cache(maxsize=None)
+def _special_re() -> re.Pattern:
+    return re.compile(r"[;{}\"']|/\*")
+
+
+@lru_cache(maxsize=None)
+def _string_re() -> re.Pattern:
+    return re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'', re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _block_header_re() -> re.Pattern:
+    return re.compile(r"(package|part\s+def|port\s+def)\s+([A-Za-z0-9_]+)")
+
+
+@lru_cache(maxsize=None)
+def _requirement_prefix_re() -> re.Pattern:
+    return re.compile(r"comment\s+([A-Za-z0-9_]+)")
+
+
+def _iter_tokens(handle: TextIO, path: Path, chunk_size: int) -> Iterator[Tuple[str, str]]:
+    """Split a character stream into statements, block braces and doc/requirement comments.
+
+    Yields ("stmt", text), ("open", header), ("close", trailing text),
+    ("doc", text) and ("requirement:<id>", text). Inline comments are dropped; quoted
+    string literals are kept verbatim, so `;`, braces or `/*` inside them do not split.
+    """
+    special = _special_re()
+    pending: List[str] = []
+    buf = ""
+    pos = 0
+    eof = False
+    while True:
+        match = special.search(buf, pos)
+        if match is not None:
+            token = match.group()
+            if token in ("\"", "'"):
+                literal = _string_re().match(buf, match.start())
+                if literal is not None:
+                    pending.append(buf[pos : literal.end()])
+                    pos = literal.end()
+                    continue
+            elif token != "/*":
+                text = "".join(pending) + buf[pos : match.start()]
+                pending.clear()
+                if token == ";":
+                    yield ("stmt", text)
+                elif token == "{":
+                    yield ("open", text)
+                else:
+                    yield ("close", text)
+                pos = match.end()
+                continue
+
+            close = buf.find("*/", match.end()) if token == "/*" else -1
+            if close != -1:
+                prefix = ("".join(pending) + buf[pos : match.start()]).strip()
+                pending.clear()
+                body = buf[match.end() : close]
+                pos = close + 2
+                requirement = _requirement_prefix_re().fullmatch(prefix)
+                if prefix == "doc":
+                    yield ("doc", whitespace_re().sub(" ", body.strip()))
+                elif requirement is not None:
+                    yield (
+                        f"requirement:{requirement.group(1)}",
+                        whitespace_re().sub(" ", body.strip()),
+                    )
+                elif prefix:
+                    # Inline comment inside a statement; keep the statement text.
+                    pending.append(prefix + " ")
+                continue
+
+        if eof:
+            if match is not None:
+                what = "comment" if match.group() == "/*" else "string"
+                raise ValueError(f"Unterminated {what} in {path}")
+            rest = "".join(pending) + buf[pos:]
+            if rest.strip():
+                yield ("stmt", rest)
+            return
+
+        # Keep an unfinished comment, or a trailing "/" that may start one, in `buf`.
+        keep_from = match.start() if match is not None else max(pos, len(buf) - 1)
+        if keep_from > pos:
+            pending.append(buf[pos:keep_from])
+        chunk = handle.read(chunk_size)
+        eof = not chunk
+        buf = buf[keep_from:] + chunk
+        pos = 0
+
+
+def iter_file_events(
+    path: Path | str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[SysMLEvent]:
+    """Yield the events of a single `.sysml` file."""
+    path = Path(path)
+    # Stack entries: [block keyword or None, name, has_members, has_doc]
+    stack: List[List[Any]] = []
+    pending_doc: Optional[str] = None
+    saw_package = False
+
+    def current() -> Optional[List[Any]]:
+        return stack[-1] if stack else None
+
+    def scope() -> Optional[str]:
+        for keyword, name, _, _ in reversed(stack):
+            if keyword in ("part def", "port def"):
+                return name
+        return None
+
+    def member(line: str) -> Optional[SysMLEvent]:
+        block = current()
+        if block is None or block[0] not in ("part def", "port def"):
+            return None
+        if line.startswith("attribute "):
+            block[2] = True
+            attr = _parse_attribute(line, pending_doc)
+            return SysMLEvent(SysMLEventKind.ATTRIBUTE, path, element=attr, scope=block[1])
+        if block[0] != "part def":
+            return None
+        for direction in ("in", "out"):
+            if line.startswith(f"{direction} port "):
+                block[2] = True
+                port = _parse_port_endpoint(direction, line, pending_doc)
+                return SysMLEvent(SysMLEventKind.PORT, path, element=port, scope=block[1])
+        if line.startswith("part "):
+            block[2] = True
+            part = _parse_part_reference(line, pending_doc)
+            return SysMLEvent(SysMLEventKind.PART, path, element=part, scope=block[1])
+        if line.startswith("connect "):
+            connection = _parse_connection(line + ";")
+            return SysMLEvent(
+                SysMLEventKind.CONNECTION, path, element=connection, scope=block[1]
+            )
+        return None
+
+    with path.open("r") as handle:
+        for token, text in _iter_tokens(handle, path, chunk_size):
+            if token == "doc":
+                block = current()
+                in_definition = block is not None and block[0] in ("part def", "port def")
+                if in_definition and not block[2] and not block[3]:
+                    block[3] = True
+                    yield SysMLEvent(
+                        SysMLEventKind.DOC, path, name=block[1], element=text, scope=scope()
+                    )
+                else:
+                    pending_doc = text
+                continue
+
+            if token.startswith("requirement:"):
+                requirement = SysMLRequirement(identifier=token.split(":", 1)[1], text=text)
+                yield SysMLEvent(
+                    SysMLEventKind.REQUIREMENT, path, element=requirement, scope=scope()
+                )
+                continue
+
+            line = text.strip()
+            if token == "open":
+                header = _block_header_re().fullmatch(line)
+                if header is None:
+                    stack.append([None, None, False, False])
+                else:
+                    keyword = " ".join(header.group(1).split())
+                    saw_package = saw_package or keyword == "package"
+                    outer = scope()
+                    stack.append([keyword, header.group(2), False, False])
+                    yield SysMLEvent(
+                        _BLOCK_KINDS[keyword][0], path, name=header.group(2), scope=outer
+                    )
+                pending_doc = None
+                continue
+
+            if line:
+                event = member(line)
+                if event is not None:
+                    yield event
+                pending_doc = None
+
+            if token == "close":
+                if not stack:
+                    raise ValueError(f"Unbalanced '}}' in {path}")
+                keyword, name, _, _ = stack.pop()
+                if keyword is not None:
+                    yield SysMLEvent(_BLOCK_KINDS[keyword][1], path, name=name, scope=scope())
+                pending_doc = None
+
+    if stack:
+        raise ValueError(f"Unterminated block while parsing SysML text in {path}")
+    if not saw_package:
+        raise ValueError(f"No package declaration found in {path}")
+
+
+def iter_events(
+    folder: Path | str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[SysMLEvent]:
+    """Yield events for every `.sysml` file of `folder` (a file selects its parent folder)."""
+    path = Path(folder)
+    if path.is_file():
+        path = path.parent
+    if not path.is_dir():
+        raise FileNotFoundError(f"SysML folder not found: {path}")
+    files = sorted(path.glob("*.sysml"))
+    if not files:
+        raise FileNotFoundError(f"No .sysml files found under {path}")
+    for file in files:
+        yield from iter_file_events(file, chunk_size)
+
+
+def build_architecture(events: Iterable[SysMLEvent]) -> SysMLArchitecture:
+    """Link an event stream into a resolved `SysMLArchitecture`."""
+    part_defs: Dict[str, SysMLPartDefinition] = {}
+    port_defs: Dict[str, SysMLPortDefinition] = {}
+    requirements: List[SysMLRequirement] = []
+    requirement_scopes: Dict[str, str] = {}
+    package_name: Optional[str] = None
+    packages: Dict[Path, str] = {}
+    definition: Any = None
+
+    for event in events:
+        kind = event.kind
+        if kind == SysMLEventKind.START_PACKAGE:
+            if event.path in packages:
+                continue
+            packages[event.path] = event.name
+            if package_name is None:
+                package_name = event.name
+            elif event.name != package_name:
+                raise ValueError(
+                    f"Mismatched package names: {package_name} vs {event.name} in {event.path}"
+                )
+        elif kind == SysMLEventKind.START_PART_DEF:
+            if event.name in part_defs:
+                raise ValueError(f"Duplicate part definition for {event.name} in {event.path}")
+            definition = part_defs[event.name] = SysMLPartDefinition(name=event.name)
+        elif kind == SysMLEventKind.START_PORT_DEF:
+            if event.name in port_defs:
+                raise ValueError(f"Duplicate port definition for {event.name} in {event.path}")
+            definition = port_defs[event.name] = SysMLPortDefinition(name=event.name)
+        elif kind in (SysMLEventKind.END_PART_DEF, SysMLEventKind.END_PORT_DEF):
+            definition = None
+        elif definition is None or definition.name != event.scope:
+            if kind == SysMLEventKind.REQUIREMENT:
+                requirements.append(event.element)
+        elif kind == SysMLEventKind.DOC:
+            definition.doc = event.element
+        elif kind == SysMLEventKind.ATTRIBUTE:
+            definition.attributes[event.element.name] = event.element
+        elif kind == SysMLEventKind.PORT:
+            definition.ports[event.element.name] = event.element
+        elif kind == SysMLEventKind.PART:
+            definition.parts[event.element.name] = event.element
+        elif kind == SysMLEventKind.CONNECTION:
+            definition.connections.append(event.element)
+        elif kind == SysMLEventKind.REQUIREMENT:
+            requirements.append(event.element)
+            requirement_scopes[event.element.identifier] = event.scope
+
+    _link_definitions(part_defs, port_defs)
+    return SysMLArchitecture(
+        package=package_name or "Package",
+        part_definitions=part_defs,
+        port_definitions=port_defs,
+        requirements=requirements,
+        _requirement_scopes=requirement_scopes,
+    )
@@ -2,37 +2,141 @@
 
 from __future__ import annotations
 
-import json
 import re
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Tuple, List
+from typing import Any, Dict, List, Tuple
 
-def to_jsonable(value: Any, suppress_list : List[Any] | None) -> Any:
-    if suppress_list is not None:
-        if value in suppress_list:
-            return "__ref__"
+_UNHASHABLE = object()
+_EXIT = object()
 
-    # Variables
-    if isinstance(value, dict):
-        return {str(key): to_jsonable(val, suppress_list) for key, val in value.items()}
-    if isinstance(value, (list, tuple, set)):
-        return [to_jsonable(item, suppress_list) for item in value]
-    if isinstance(value, Path):
-        return str(value)
-    if isinstance(value, Enum):  # Must be first to not recurse into enum internals.
-        return str(value.value)
 
-    # Class
-    if hasattr(value, "__dict__"):
-        if suppress_list is not None:
-            suppress_list.append(value)
-        return {str(key): to_jsonable(val, suppress_list) for key, val in vars(value).items()}
+def _field_key(value: Any) -> Any:
+    """Hashable summary of a dataclass instance; equal instances share it."""
+    parts: List[Any] = [type(value)]
+    for name, spec in value.__dataclass_fields__.items():
+        if not spec.compare:
+            continue
+        field_value = getattr(value, name)
+        try:
+            hash(field_value)
+        except TypeError:
+            field_value = _UNHASHABLE
+        parts.append(field_value)
+    return tuple(parts)
 
-    return value
+
+class _SuppressList:
+    """``value in suppress_list`` for `to_jsonable` without a linear scan per value.
+
+    Entries appended during the export are found by identity or, for dataclass
+    instances (whose ``==`` compares fields), among same-class entries with equal
+    hashable fields. Entries passed in by the caller are still checked with ``in``.
+    """
+
+    def __init__(self, items: List[Any]):
+        self.items = items
+        self._initial = list(items)
+        self._ids: Dict[int, Any] = {}
+        self._by_fields: Dict[Any, List[Any]] = {}
+        self._linear = False
+
+    def __contains__(self, value: Any) -> bool:
+        if self._linear:
+            return value in self.items
+        if id(value) in self._ids or (self._initial and value in self._initial):
+            return True
+        if _dataclass_eq(value):
+            candidates = self._by_fields.get(_field_key(value), ())
+            return any(value == entry for entry in candidates)
+        return False
+
+    def append(self, value: Any) -> None:
+        self.items.append(value)
+        self._ids[id(value)] = value
+        if _dataclass_eq(value):
+            self._by_fields.setdefault(_field_key(value), []).append(value)
+        elif type(value).__eq__ is not object.__eq__:
+            # Arbitrary equality: fall back to the plain list semantics.
+            self._linear = True
+
+
+def _dataclass_eq(value: Any) -> bool:
+    params = getattr(type(value), "__dataclass_params__", None)
+    return params is not None and params.eq
+
+
+def to_jsonable(value: Any, suppress_list: List[Any] | None) -> Any:
+    """Convert a model graph into JSON-compatible dicts and lists.
+
+    Objects are exported as dicts of their public attributes (or of the ``(key, value)``
+    pairs returned by their class's ``_export_items``). With a `suppress_list`,
+    objects are recorded on first export and repeated occurrences become ``"__ref__"``;
+    without one, shared objects are exported in full and cycles raise `ValueError`.
+    Uses an explicit stack, so nesting depth is not limited by the recursion limit.
+    """
+    suppress = _SuppressList(suppress_list) if suppress_list is not None else None
+    # Object ids on the current path, only needed to detect cycles without a suppress list.
+    active: Dict[int, Any] = {}
+    holder: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any]] = [(value, holder, 0)]
+    while stack:
+        item, target, slot = stack.pop()
+        if item is _EXIT:
+            del active[slot]
+            continue
+        if suppress is not None and item in suppress:
+            target[slot] = "__ref__"
+            continue
+
+        # Variables
+        if isinstance(item, dict):
+            children = [(str(key), val) for key, val in item.items()]
+            result: Any = dict.fromkeys(key for key, _ in children)
+        elif isinstance(item, (list, tuple, set)):
+            children = list(enumerate(item))
+            result = [None] * len(children)
+        elif isinstance(item, Path):
+            target[slot] = str(item)
+            continue
+        elif isinstance(item, Enum):  # Must be first to not recurse into enum internals.
+            target[slot] = str(item.value)
+            continue
+
+        # Class
+        elif hasattr(item, "__dict__"):
+            if suppress is not None:
+                suppress.append(item)
+            else:
+                if id(item) in active:
+                    raise ValueError("Circular reference detected")
+                active[id(item)] = item
+                stack.append((_EXIT, None, id(item)))
+            export_items = getattr(type(item), "_export_items", None)
+            if export_items is not None:
+                # Classes may choose their exported attributes and their order.
+                children = export_items(item)
+            else:
+                # Underscore attributes hold derived caches (e.g. indexes), not model data.
+                children = [
+                    (str(key), val)
+                    for key, val in vars(item).items()
+                    if not str(key).startswith("_")
+                ]
+            result = dict.fromkeys(key for key, _ in children)
+        else:
+            target[slot] = item
+            continue
+
+        target[slot] = result
+        stack.extend((val, result, key) for key, val in reversed(children))
+    return holder[0]
 
 
 def json_dumps(value: Any, suppress_list = None) -> str:
+    import json
+
     return json.dumps(to_jsonable(value, suppress_list), indent=2, sort_keys=True)
 
 
@@ -64,8 +168,14 @@ def strip_inline_comment(line: str) -> str:
     return result.strip()
 
 
+@lru_cache(maxsize=None)
+def whitespace_re() -> re.Pattern:
+    """Compiled on first use to keep module import cheap."""
+    return re.compile(r"\s+")
+
+
 def normalize_doc(text: str) -> str:
     start = text.find("/*")
     end = text.rfind("*/")
     slice_ = text[start + 2 : end] if start != -1 and end != -1 else text
-    return re.sub(r"\s+", " ", slice_.strip())
+    return whitespace_re().sub(" ", slice_.strip())
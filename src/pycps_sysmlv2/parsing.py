@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 import re
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .definitions import (
     SysMLArchitecture,
@@ -17,83 +19,215 @@ from .definitions import (
     SysMLPortReference,
     SysMLRequirement,
 )
-from .parser_utils import collect_block, normalize_doc, strip_inline_comment
+from .discovery import Patterns, Roots, as_roots, discover_sysml_files
+from .parser_utils import (
+    collect_block,
+    normalize_doc,
+    strip_inline_comment,
+    whitespace_re,
+)
 
 
 class SysMLFolderParser:
-    """Parse and merge all `.sysml` files within a directory."""
-
-    def __init__(self, folder: Path | str):
-        self.folder = Path(folder)
-        if not self.folder.is_dir():
-            raise FileNotFoundError(f"SysML folder not found: {self.folder}")
+    """Parse and merge all `.sysml` files within one or more directories.
+
+    `folder` may be a single path or a sequence of model roots (e.g. a model folder
+    plus shared library folders); all files must declare the same package. With
+    ``recursive=True`` subdirectories are included, filtered by `include`/`exclude`
+    glob patterns (see `pycps_sysmlv2.discovery`).
+
+    With ``validate=True`` an extra pass checks that connected ports agree on
+    direction and payload types, raising one `ValueError` listing every mismatch.
+    """
+
+    def __init__(
+        self,
+        folder: Roots,
+        validate: bool = False,
+        recursive: bool = False,
+        include: Patterns = None,
+        exclude: Patterns = None,
+    ):
+        self.folders = as_roots(folder)
+        self.folder = self.folders[0]
+        self.validate = validate
+        self.recursive = recursive
+        self.include = include
+        self.exclude = exclude
 
     def parse(self) -> SysMLArchitecture:
-        files = sorted(self.folder.glob("*.sysml"))
+        files = discover_sysml_files(
+            self.folders, self.recursive, self.include, self.exclude
+        )
         if not files:
-            raise FileNotFoundError(f"No .sysml files found under {self.folder}")
-
-        part_defs: Dict[str, SysMLPartDefinition] = {}
-        port_defs: Dict[str, SysMLPortDefinition] = {}
-        requirements: List[SysMLRequirement] = []
-        package_name: Optional[str] = None
-
-        for path in files:
-            text = path.read_text()
-            pkg, body = _extract_package_body(text, path)
-            if package_name is None:
-                package_name = pkg
-            elif pkg != package_name:
-                raise ValueError(
-                    f"Mismatched package names: {package_name} vs {pkg} in {path}"
-                )
+            roots = ", ".join(str(folder) for folder in self.folders)
+            raise FileNotFoundError(f"No .sysml files found under {roots}")
+        architecture = _link_files([_parse_file(path) for path in files])
+        if self.validate:
+            from .validation import raise_for_issues, validate_connections
+
+            raise_for_issues(validate_connections(architecture))
+        return architecture
+
+
+@dataclass
+class _ParsedFile:
+    """Unlinked definitions of one `.sysml` file; linking happens across all files."""
+
+    path: Path
+    package: str
+    part_definitions: Dict[str, SysMLPartDefinition] = field(default_factory=dict)
+    port_definitions: Dict[str, SysMLPortDefinition] = field(default_factory=dict)
+    requirements: List[SysMLRequirement] = field(default_factory=list)
+    requirement_scopes: Dict[str, str] = field(default_factory=dict)
+    # Raw block text per (keyword, name), used to tell which definitions changed.
+    blocks: Dict[Tuple[str, str], str] = field(default_factory=dict)
+
+
+def _parse_file(path: Path) -> _ParsedFile:
+    pkg, body = _extract_package_body(path.read_text(), path)
+    parsed = _ParsedFile(path=path, package=pkg)
+
+    for name, block in _extract_named_blocks(body, "part def"):
+        if name in parsed.part_definitions:
+            raise ValueError(f"Duplicate part definition for {name} in {path}")
+        parsed.part_definitions[name] = _parse_part_block(name, block)
+        parsed.blocks["part def", name] = block
+        _collect_requirement_scopes(name, block, parsed.requirement_scopes)
+
+    for name, block in _extract_named_blocks(body, "port def"):
+        if name in parsed.port_definitions:
+            raise ValueError(f"Duplicate port definition for {name} in {path}")
+        parsed.port_definitions[name] = _parse_port_block(name, block)
+        parsed.blocks["port def", name] = block
+        _collect_requirement_scopes(name, block, parsed.requirement_scopes)
+
+    parsed.requirements.extend(_parse_requirements(body))
+    return parsed
+
+
+def _link_files(files: List[_ParsedFile]) -> SysMLArchitecture:
+    """Merge per-file results and resolve references between definitions.
+
+    Linking assigns the `*_def` fields of the (shared) reference objects in place, so
+    re-linking a mix of fresh and previously parsed files is safe; if linking fails,
+    no reference is modified.
+    """
+    part_defs: Dict[str, SysMLPartDefinition] = {}
+    port_defs: Dict[str, SysMLPortDefinition] = {}
+    requirements: List[SysMLRequirement] = []
+    requirement_scopes: Dict[str, str] = {}
+    package_name: Optional[str] = None
+
+    for parsed in files:
+        if package_name is None:
+            package_name = parsed.package
+        elif parsed.package != package_name:
+            raise ValueError(
+                f"Mismatched package names: {package_name} vs {parsed.package} "
+                f"in {parsed.path}"
+            )
+        for name, part_def in parsed.part_definitions.items():
+            if name in part_defs:
+                raise ValueError(f"Duplicate part definition for {name} in {parsed.path}")
+            part_defs[name] = part_def
+        for name, port_def in parsed.port_definitions.items():
+            if name in port_defs:
+                raise ValueError(f"Duplicate port definition for {name} in {parsed.path}")
+            port_defs[name] = port_def
+        requirements.extend(parsed.requirements)
+        requirement_scopes.update(parsed.requirement_scopes)
+
+    _link_definitions(part_defs, port_defs)
+    return SysMLArchitecture(
+        package=package_name or "Package",
+        part_definitions=part_defs,
+        port_definitions=port_defs,
+        requirements=requirements,
+        _requirement_scopes=requirement_scopes,
+    )
 
-            for name, block in _extract_named_blocks(body, "part def"):
-                if name in part_defs:
-                    raise ValueError(f"Duplicate part definition for {name} in {path}")
-                part_defs[name] = _parse_part_block(name, block)
 
-            for name, block in _extract_named_blocks(body, "port def"):
-                if name in port_defs:
-                    raise ValueError(f"Duplicate port definition for {name} in {path}")
-                port_defs[name] = _parse_port_block(name, block)
+def load_architecture(
+    folder: Roots,
+    validate: bool = False,
+    cache: bool = False,
+    recursive: bool = False,
+    include: Patterns = None,
+    exclude: Patterns = None,
+) -> SysMLArchitecture:
+    """Parse a folder (or a file's parent folder) into a linked architecture.
+
+    Pass a list of folders to merge several model roots into one package, and
+    ``recursive=True`` (optionally with `include`/`exclude` globs) to read nested
+    directories.
+
+    With ``cache=True`` the result is memoized in a process-wide LRU keyed by the roots,
+    the discovery options and a stat fingerprint of the `.sysml` files (see
+    `pycps_sysmlv2.cache`); repeated loads of unchanged files return the same, shared
+    architecture object.
+    """
+    if not cache:
+        return SysMLFolderParser(
+            folder, validate, recursive=recursive, include=include, exclude=exclude
+        ).parse()
+
+    from .cache import load_architecture_memoized
+
+    architecture = load_architecture_memoized(
+        as_roots(folder), recursive=recursive, include=include, exclude=exclude
+    )
+    if validate:
+        from .validation import raise_for_issues, validate_connections
+
+        raise_for_issues(validate_connections(architecture))
+    return architecture
+
+
+def load_system(
+    folder: Roots,
+    system_part: str,
+    validate: bool = False,
+    cache: bool = False,
+    recursive: bool = False,
+    include: Patterns = None,
+    exclude: Patterns = None,
+):
+    a = load_architecture(
+        folder, validate, cache, recursive=recursive, include=include, exclude=exclude
+    )
+    if system_part not in a.part_definitions:
+        raise KeyError(f"Part not found: {system_part}")
+    return a.part_definitions[system_part]
 
-            requirements.extend(_parse_requirements(body))
 
-        _attach_port_definitions(part_defs, port_defs)
-        _attach_part_definitions(part_defs)
+# Patterns are compiled on first use so that importing the package stays cheap.
 
-        _attach_connection_definitions(part_defs, port_defs)
-        return SysMLArchitecture(
-            package=package_name or "Package",
-            part_definitions=part_defs,
-            port_definitions=port_defs,
-            requirements=requirements,
-        )
 
+@lru_cache(maxsize=None)
+def _package_re() -> re.Pattern:
+    return re.compile(r"package\s+([A-Za-z0-9_]+)\s*\{", re.MULTILINE)
 
-def load_architecture(folder: Path | str) -> SysMLArchitecture:
-    path = Path(folder)
-    if path.is_file():
-        path = path.parent
-    return SysMLFolderParser(path).parse()
 
+@lru_cache(maxsize=None)
+def _connection_re() -> re.Pattern:
+    return re.compile(
+        r"connect\s+([A-Za-z0-9_]+)\.([A-Za-z0-9_]+)\s+to\s+([A-Za-z0-9_]+)\.([A-Za-z0-9_]+)\s*;"
+    )
 
-def load_system(folder: Path | str, system_part: str):
-    a = load_architecture(folder)
-    if system_part not in a.part_definitions:
-        raise KeyError(f"Part not found: {system_part}")
-    return a.part_definitions[system_part]
 
+@lru_cache(maxsize=None)
+def _named_block_re(keyword: str) -> re.Pattern:
+    return re.compile(rf"{keyword}\s+([A-Za-z0-9_]+)\s*\{{", re.MULTILINE)
 
-_PACKAGE_RE = re.compile(r"package\s+([A-Za-z0-9_]+)\s*\{", re.MULTILINE)
-_CONNECTION_RE = re.compile(
-    r"connect\s+([A-Za-z0-9_]+)\.([A-Za-z0-9_]+)\s+to\s+([A-Za-z0-9_]+)\.([A-Za-z0-9_]+)\s*;"
-)
+
+@lru_cache(maxsize=None)
+def _requirement_re() -> re.Pattern:
+    return re.compile(r"comment\s+([A-Za-z0-9_]+)\s*/\*\s*(.*?)\s*\*/", re.DOTALL)
 
 
 def _extract_package_body(text: str, path: Path) -> Tuple[str, str]:
-    match = _PACKAGE_RE.search(text)
+    match = _package_re().search(text)
     if not match:
         raise ValueError(f"No package declaration found in {path}")
     pkg_name = match.group(1)
@@ -103,7 +237,7 @@ def _extract_package_body(text: str, path: Path) -> Tuple[str, str]:
 
 
 def _extract_named_blocks(body: str, keyword: str) -> List[Tuple[str, str]]:
-    pattern = re.compile(rf"{keyword}\s+([A-Za-z0-9_]+)\s*\{{", re.MULTILINE)
+    pattern = _named_block_re(keyword)
     blocks: List[Tuple[str, str]] = []
     idx = 0
     while True:
@@ -245,7 +379,7 @@ def _parse_part_reference(line: str, doc: Optional[str]) -> SysMLPartReference:
 
 
 def _parse_connection(line: str) -> SysMLConnection:
-    match = _CONNECTION_RE.fullmatch(line.strip())
+    match = _connection_re().fullmatch(line.strip())
     if match is None:
         raise ValueError(f"Malformed connection declaration: {line}")
     return SysMLConnection(
@@ -256,27 +390,28 @@ def _parse_connection(line: str) -> SysMLConnection:
     )
 
 
-def _attach_port_definitions(
+def _link_definitions(
     parts: Dict[str, SysMLPartDefinition], port_defs: Dict[str, SysMLPortDefinition]
 ) -> None:
+    """Resolve the `*_def` fields of every reference, then assign them.
+
+    All links are resolved before any is written, so a failing link (e.g. a renamed
+    port definition) leaves reference objects shared with an earlier architecture as
+    they were.
+    """
+    links: List[Tuple[Any, str, Any]] = []
     for part in parts.values():
         for port in part.ports.values():
-            port.port_def = port_defs.get(port.port_name)
-            if port.port_def is None:
+            port_def = port_defs.get(port.port_name)
+            if port_def is None:
                 raise ValueError(
                     f"Port definition not found for {part.name}.{port.name}: {port.port_name}"
                 )
+            links.append((port, "port_def", port_def))
 
-
-def _attach_part_definitions(parts: Dict[str, SysMLPartDefinition]) -> None:
     for part in parts.values():
         for subpart in part.parts.values():
-            subpart.part_def = parts.get(subpart.part_name)
-
-
-def _attach_connection_definitions(
-    parts: Dict[str, SysMLPartDefinition], ports: Dict[str, SysMLPortDefinition]
-) -> None:
+            links.append((subpart, "part_def", parts.get(subpart.part_name)))
 
     for part in parts.values():
         for c in part.connections:
@@ -289,38 +424,35 @@ def _attach_connection_definitions(
                     f"Subpart not found for connection: {part.name}.{c.dst_component}"
                 )
 
-            c.src_part_def = part.parts[c.src_component].part_def
-            c.dst_part_def = part.parts[c.dst_component].part_def
-            if c.src_part_def is None:
+            src_part_def = parts.get(part.parts[c.src_component].part_name)
+            dst_part_def = parts.get(part.parts[c.dst_component].part_name)
+            if src_part_def is None:
                 raise ValueError(
                     f"Part definition not found for subpart {part.name}.{c.src_component}"
                 )
-            if c.dst_part_def is None:
+            if dst_part_def is None:
                 raise ValueError(
                     f"Part definition not found for subpart {part.name}.{c.dst_component}"
                 )
 
-            if c.src_port not in c.src_part_def.ports:
+            if c.src_port not in src_part_def.ports:
                 raise ValueError(
-                    f"Port not found for connection: {c.src_part_def.name}.{c.src_port}"
+                    f"Port not found for connection: {src_part_def.name}.{c.src_port}"
                 )
-            if c.dst_port not in c.dst_part_def.ports:
+            if c.dst_port not in dst_part_def.ports:
                 raise ValueError(
-                    f"Port not found for connection: {c.dst_part_def.name}.{c.dst_port}"
+                    f"Port not found for connection: {dst_part_def.name}.{c.dst_port}"
                 )
 
-            c.src_port_def = c.src_part_def.ports[c.src_port].port_def
-            c.dst_port_def = c.dst_part_def.ports[c.dst_port].port_def
-            if c.src_port_def is None:
-                raise ValueError(
-                    f"Port definition not found for connection endpoint: "
-                    f"{c.src_part_def.name}.{c.src_port}"
-                )
-            if c.dst_port_def is None:
-                raise ValueError(
-                    f"Port definition not found for connection endpoint: "
-                    f"{c.dst_part_def.name}.{c.dst_port}"
-                )
+            # Every port of a linked part definition was resolved above.
+            links.append((c, "src_part_def", src_part_def))
+            links.append((c, "dst_part_def", dst_part_def))
+            links.append((c, "src_port_def", port_defs[src_part_def.ports[c.src_port].port_name]))
+            links.append((c, "dst_port_def", port_defs[dst_part_def.ports[c.dst_port].port_name]))
+
+    for obj, name, value in links:
+        setattr(obj, name, value)
+
 
 def _iter_block_items(block: str) -> Iterator[Tuple[str, str]]:
     lines = block.splitlines()
@@ -343,11 +475,18 @@ def _iter_block_items(block: str) -> Iterator[Tuple[str, str]]:
             yield ("stmt", stripped)
 
 
+def _collect_requirement_scopes(name: str, block: str, scopes: Dict[str, str]) -> None:
+    """Record requirements declared inside a definition block as scoped to it."""
+    if "comment" not in block:
+        return
+    for req in _parse_requirements(block):
+        scopes[req.identifier] = name
+
+
 def _parse_requirements(body: str) -> List[SysMLRequirement]:
     reqs: List[SysMLRequirement] = []
-    pattern = re.compile(r"comment\s+([A-Za-z0-9_]+)\s*/\*\s*(.*?)\s*\*/", re.DOTALL)
-    for match in pattern.finditer(body):
+    for match in _requirement_re().finditer(body):
         identifier = match.group(1)
-        text = re.sub(r"\s+", " ", match.group(2).strip())
+        text = whitespace_re().sub(" ", match.group(2).strip())
         reqs.append(SysMLRequirement(identifier=identifier, text=text))
     return reqs
@@ -0,0 +1,248 @@
+"""Path-style selectors over a parsed architecture graph.
+
+A query is a `/`-separated path evaluated from the architecture's part definitions:
+
+- the first segment selects part definitions by name (`AircraftComposition`, `*`)
+- a plain segment selects subparts of the current part (`autopilot`, `*`)
+- `in:`, `out:` or `port:` segments select ports of the current part (`out:*`)
+- an `@` segment selects attributes of the current part, or of the current port's
+  payload definition (`@*`, `@roll_deg`)
+
+Every segment accepts glob names and trailing `[key=value]` filters, for example
+`AircraftComposition/*/out:*/@[type=Real]`. Supported keys are `name`, `type`
+(attributes: primitive or full type name; ports/parts: referenced definition name)
+and `direction` (ports).
+
+Queries are compiled once into a list of steps and cached by expression; results are
+produced lazily. Literal names use dictionary lookups instead of scanning.
+
+References are recognised by their `part_def`/`port_def` attributes rather than by
+class, so queries also run on the read-only views of `pycps_sysmlv2.shared`.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from fnmatch import translate
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .definitions import SysMLArchitecture, SysMLAttribute, SysMLPartDefinition
+
+_GLOB_CHARS = set("*?")
+_SEGMENT_RE = re.compile(
+    r"(?:(?P<direction>in|out|port):|(?P<attr>@))?(?P<name>[^\[\]]*)(?P<filters>(?:\[[^\[\]]*\])*)"
+)
+_FILTER_RE = re.compile(r"\[\s*([A-Za-z_]+)\s*=\s*([^\]]*?)\s*\]")
+_FILTER_KEYS = {
+    "part": {"name", "type"},
+    "port": {"name", "type", "direction"},
+    "attribute": {"name", "type"},
+}
+
+
+@dataclass
+class QueryStep:
+    kind: str  # "root", "part", "port" or "attribute"
+    name: str = "*"
+    direction: Optional[str] = None
+    filters: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def literal(self) -> Optional[str]:
+        """Return the exact name to look up, or None when the name is a glob."""
+        if _GLOB_CHARS.intersection(self.name):
+            return None
+        return self.name
+
+    def name_matcher(self) -> Callable[[str], bool]:
+        if self.name == "*":
+            return lambda name: True
+        return re.compile(translate(self.name)).match
+
+
+class SysMLQuery:
+    """A compiled selector; call `execute(architecture)` to iterate matches."""
+
+    def __init__(self, expression: str, steps: List[QueryStep]):
+        self.expression = expression
+        self.steps = steps
+        self._plan = [_compile_step(step) for step in steps]
+
+    def execute(self, architecture: SysMLArchitecture) -> Iterator[Any]:
+        results: Iterable[Any] = self._plan[0](architecture)
+        for stage in self._plan[1:]:
+            results = stage(results)
+        return iter(results)
+
+    __call__ = execute
+
+    def __repr__(self) -> str:
+        return f"SysMLQuery({self.expression!r})"
+
+
+@lru_cache(maxsize=256)
+def compile_query(expression: str) -> SysMLQuery:
+    """Parse `expression` into a reusable query. Results are cached per expression."""
+    segments = [segment.strip() for segment in expression.strip().split("/")]
+    if not segments or not all(segments):
+        raise ValueError(f"Malformed query (empty segment): {expression!r}")
+
+    steps: List[QueryStep] = []
+    for position, segment in enumerate(segments):
+        match = _SEGMENT_RE.fullmatch(segment)
+        if match is None:
+            raise ValueError(f"Malformed query segment {segment!r} in {expression!r}")
+
+        if match.group("attr"):
+            kind = "attribute"
+        elif match.group("direction"):
+            kind = "port"
+        else:
+            kind = "part" if position else "root"
+
+        if position == 0 and kind != "root":
+            raise ValueError(f"Query must start with a part definition name: {expression!r}")
+        if steps and steps[-1].kind == "attribute":
+            raise ValueError(f"Attributes have no children in query: {expression!r}")
+        if kind == "part" and steps[-1].kind == "port":
+            raise ValueError(f"Ports have no subparts in query: {expression!r}")
+        if kind == "port" and steps[-1].kind == "port":
+            raise ValueError(f"Ports have no nested ports in query: {expression!r}")
+
+        filters = _FILTER_RE.findall(match.group("filters"))
+        allowed = _FILTER_KEYS["part" if kind == "root" else kind]
+        for key, _ in filters:
+            if key not in allowed:
+                raise ValueError(f"Unsupported filter [{key}=...] on {kind} segment: {segment!r}")
+
+        direction = match.group("direction")
+        steps.append(
+            QueryStep(
+                kind=kind,
+                name=match.group("name").strip() or "*",
+                direction=None if direction in (None, "port") else direction,
+                filters=filters,
+            )
+        )
+    return SysMLQuery(expression, steps)
+
+
+def query(architecture: SysMLArchitecture, expression: str) -> Iterator[Any]:
+    """Lazily yield the model objects selected by `expression`."""
+    return compile_query(expression).execute(architecture)
+
+
+def _attribute_type_names(attr: SysMLAttribute) -> Tuple[str, ...]:
+    if attr.type is None:
+        return ()
+    return (attr.type.primitive_type_str(), attr.type.as_string())
+
+
+def _matches_filters(step: QueryStep, item: Any) -> bool:
+    for key, expected in step.filters:
+        if key == "name":
+            if item.name != expected:
+                return False
+        elif key == "direction":
+            if item.direction != expected:
+                return False
+        elif key == "type":
+            if isinstance(item, SysMLAttribute):
+                if expected not in _attribute_type_names(item):
+                    return False
+            elif _is_port_reference(item):
+                if item.port_name != expected:
+                    return False
+            elif _is_part_reference(item):
+                if item.part_name != expected:
+                    return False
+            elif item.name != expected:
+                return False
+    return True
+
+
+def _select(step: QueryStep, mapping: dict) -> Iterator[Any]:
+    literal = step.literal
+    if literal is not None:
+        item = mapping.get(literal)
+        if item is not None:
+            yield item
+        return
+    matcher = step.name_matcher()
+    for name, item in mapping.items():
+        if matcher(name):
+            yield item
+
+
+def _compile_step(step: QueryStep) -> Callable[[Any], Iterator[Any]]:
+    def keep(item: Any) -> bool:
+        if step.direction is not None and item.direction != step.direction:
+            return False
+        return not step.filters or _matches_filters(step, item)
+
+    if step.kind == "root":
+
+        def run_root(architecture: SysMLArchitecture) -> Iterator[Any]:
+            for part in _select(step, architecture.part_definitions):
+                if keep(part):
+                    yield part
+
+        return run_root
+
+    if step.kind == "part":
+
+        def run_parts(parents: Iterable[Any]) -> Iterator[Any]:
+            for parent in parents:
+                part_def = _as_part_definition(parent)
+                if part_def is None:
+                    continue
+                for ref in _select(step, part_def.parts):
+                    if keep(ref):
+                        yield ref
+
+        return run_parts
+
+    if step.kind == "port":
+
+        def run_ports(parents: Iterable[Any]) -> Iterator[Any]:
+            for parent in parents:
+                part_def = _as_part_definition(parent)
+                if part_def is None:
+                    continue
+                for port in _select(step, part_def.ports):
+                    if keep(port):
+                        yield port
+
+        return run_ports
+
+    def run_attributes(parents: Iterable[Any]) -> Iterator[Any]:
+        for parent in parents:
+            if _is_port_reference(parent):
+                owner = parent.port_def
+            else:
+                owner = _as_part_definition(parent)
+            if owner is None:
+                continue
+            for attr in _select(step, owner.attributes):
+                if keep(attr):
+                    yield attr
+
+    return run_attributes
+
+
+def _is_port_reference(item: Any) -> bool:
+    """True for `SysMLPortReference` and its shared-memory view."""
+    return hasattr(item, "port_def")
+
+
+def _is_part_reference(item: Any) -> bool:
+    """True for `SysMLPartReference` and its shared-memory view."""
+    return hasattr(item, "part_def")
+
+
+def _as_part_definition(item: Any) -> Optional[SysMLPartDefinition]:
+    if _is_part_reference(item):
+        return item.part_def
+    return item
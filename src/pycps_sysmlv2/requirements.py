@@ -0,0 +1,177 @@
+"""Requirement lookup and keyword search.
+
+`SysMLRequirementIndex` keeps an identifier -> requirement map, an inverted token index
+for keyword and prefix search, and the scope each requirement was declared in (`None`
+for package level, otherwise the enclosing part/port definition name). Requirements
+link to the definitions that share their scope: the enclosing definition, or every
+package-level definition for package-level requirements.
+
+The index is built lazily by `SysMLArchitecture.requirement_index()`, can be grown with
+`add`/`remove`, and is pickled together with the architecture by the disk cache.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from heapq import merge
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from .definitions import SysMLArchitecture, SysMLRequirement
+
+
+@lru_cache(maxsize=None)
+def _token_re() -> re.Pattern:
+    return re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case alphanumeric tokens; `_` and punctuation separate tokens."""
+    return _token_re().findall(text.lower())
+
+
+class SysMLRequirementIndex:
+    def __init__(self) -> None:
+        self._by_id: Dict[str, SysMLRequirement] = {}
+        self._scopes: Dict[str, Optional[str]] = {}
+        # scope -> identifiers declared there (dicts as ordered sets), and the insertion
+        # position of each identifier, so lookups and searches never scan every entry.
+        self._by_scope: Dict[Optional[str], Dict[str, None]] = {}
+        self._positions: Dict[str, int] = {}
+        self._added = 0
+        self._postings: Dict[str, Set[str]] = {}
+        self._sorted_tokens: Optional[List[str]] = None
+        self._package_definitions: Dict[str, None] = {}
+
+    # Building
+
+    def add(self, requirement: SysMLRequirement, scope: Optional[str] = None) -> None:
+        """Index `requirement`, replacing any requirement with the same identifier."""
+        identifier = requirement.identifier
+        if identifier in self._by_id:
+            self.remove(identifier)
+        self._by_id[identifier] = requirement
+        self._scopes[identifier] = scope
+        self._by_scope.setdefault(scope, {})[identifier] = None
+        self._positions[identifier] = self._added
+        self._added += 1
+        for token in set(tokenize(identifier)) | set(tokenize(requirement.text)):
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = {identifier}
+                self._sorted_tokens = None
+            else:
+                postings.add(identifier)
+
+    def remove(self, identifier: str) -> None:
+        requirement = self._by_id.pop(identifier)
+        scope = self._scopes.pop(identifier)
+        in_scope = self._by_scope[scope]
+        del in_scope[identifier]
+        if not in_scope:
+            del self._by_scope[scope]
+        del self._positions[identifier]
+        for token in set(tokenize(identifier)) | set(tokenize(requirement.text)):
+            postings = self._postings[token]
+            postings.discard(identifier)
+            if not postings:
+                del self._postings[token]
+                self._sorted_tokens = None
+
+    def add_definitions(self, names: Iterable[str]) -> None:
+        """Register package-level definition names for requirement linking."""
+        self._package_definitions.update(dict.fromkeys(names))
+
+    @classmethod
+    def from_architecture(cls, architecture: SysMLArchitecture) -> "SysMLRequirementIndex":
+        index = cls()
+        scopes = architecture._requirement_scopes
+        for requirement in architecture.requirements:
+            index.add(requirement, scopes.get(requirement.identifier))
+        index.add_definitions(architecture.port_definitions)
+        index.add_definitions(architecture.part_definitions)
+        return index
+
+    @classmethod
+    def from_events(cls, events: Iterable) -> "SysMLRequirementIndex":
+        """Build from a `pycps_sysmlv2.events` stream without linking the model."""
+        from .events import SysMLEventKind
+
+        index = cls()
+        for event in events:
+            if event.kind == SysMLEventKind.REQUIREMENT:
+                index.add(event.element, event.scope)
+            elif event.kind in (SysMLEventKind.START_PART_DEF, SysMLEventKind.START_PORT_DEF):
+                if event.scope is None:
+                    index.add_definitions([event.name])
+        return index
+
+    # Lookup
+
+    def get(self, identifier: str) -> Optional[SysMLRequirement]:
+        return self._by_id.get(identifier)
+
+    def __getitem__(self, identifier: str) -> SysMLRequirement:
+        return self._by_id[identifier]
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[SysMLRequirement]:
+        return iter(self._by_id.values())
+
+    def scope_of(self, identifier: str) -> Optional[str]:
+        return self._scopes[identifier]
+
+    def definitions_for(self, identifier: str) -> List[str]:
+        """Names of the definitions sharing the requirement's scope."""
+        scope = self._scopes[identifier]
+        if scope is None:
+            return list(self._package_definitions)
+        return [scope]
+
+    def requirements_for(self, definition: str) -> List[SysMLRequirement]:
+        """Requirements declared inside `definition` or in its (package) scope."""
+        identifiers: Iterable[str] = self._by_scope.get(definition, ())
+        if definition in self._package_definitions and None in self._by_scope:
+            # Interleave both groups in insertion order.
+            identifiers = merge(
+                identifiers, self._by_scope[None], key=self._positions.__getitem__
+            )
+        return [self._by_id[identifier] for identifier in identifiers]
+
+    def search(self, query: str) -> List[SysMLRequirement]:
+        """Return requirements containing every query token, in insertion order.
+
+        A token ending in `*` matches as a prefix, e.g. `waypoint* fly`.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        matched: Optional[Set[str]] = None
+        for term in terms:
+            prefix = term.endswith("*")
+            for token in tokenize(term) or [""]:
+                ids = self._prefix_postings(token) if prefix else self._postings.get(token, set())
+                matched = set(ids) if matched is None else matched & ids
+                if not matched:
+                    return []
+        return [
+            self._by_id[identifier]
+            for identifier in sorted(matched, key=self._positions.__getitem__)
+        ]
+
+    def _prefix_postings(self, prefix: str) -> Set[str]:
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        tokens = self._sorted_tokens
+        result: Set[str] = set()
+        for i in range(bisect_left(tokens, prefix), len(tokens)):
+            if not tokens[i].startswith(prefix):
+                break
+            result |= self._postings[tokens[i]]
+        return result
@@ -0,0 +1,566 @@
+"""Share a parsed architecture with worker processes through `multiprocessing.shared_memory`.
+
+The producer flattens the object graph into one shared block holding a string table and
+integer-indexed row arrays for definitions, references, connections, attributes and
+requirements. Workers attach by block name and get read-only views that expose the same
+attributes as the model classes. Rows are decoded on access, so every worker maps the
+same physical memory instead of holding its own copy of the graph.
+
+Producer::
+
+    with share_architecture(architecture) as shared:
+        pool.map(work, [(shared.name, part) for part in parts])
+
+Worker::
+
+    with attach_architecture(name) as architecture:
+        system = architecture.part_definitions["AircraftComposition"]
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import sys
+from array import array
+from multiprocessing import shared_memory
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .definitions import (
+    PrimitiveType,
+    SysMLArchitecture,
+    SysMLAttribute,
+    SysMLPartDefinition,
+    SysMLType,
+)
+
+_MAGIC = 0x53594D4C  # "SYML"
+_LAYOUT_VERSION = 1
+_NONE = -1
+
+# Columns per row of each table.
+_ATTRIBUTE_WIDTH = 5  # name, type, type definition, value literal, doc
+_PORT_DEF_WIDTH = 4  # name, doc, first attribute, attribute count
+_PART_DEF_WIDTH = 10  # name, doc, then (first, count) for attributes/ports/parts/connections
+_PORT_REF_WIDTH = 5  # name, direction, port name, doc, port definition
+_PART_REF_WIDTH = 4  # name, part name, doc, part definition
+_CONNECTION_WIDTH = 8  # 4 endpoint names, src/dst part definition, src/dst port definition
+_REQUIREMENT_WIDTH = 2  # identifier, text
+
+_WIDTHS = {
+    "attributes": _ATTRIBUTE_WIDTH,
+    "port_defs": _PORT_DEF_WIDTH,
+    "part_defs": _PART_DEF_WIDTH,
+    "port_refs": _PORT_REF_WIDTH,
+    "part_refs": _PART_REF_WIDTH,
+    "connections": _CONNECTION_WIDTH,
+    "requirements": _REQUIREMENT_WIDTH,
+}
+_TABLES = tuple(_WIDTHS)
+# magic, version, package, string count, string blob bytes, then (offset, rows) per table
+_HEADER_WORDS = 5 + 2 * len(_TABLES)
+
+# Names of the blocks created (and not yet unlinked) by this process.
+_OWNED: Set[str] = set()
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self._string_index: Dict[str, int] = {}
+        self.tables: Dict[str, List[int]] = {name: [] for name in _TABLES}
+
+    def string(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        index = self._string_index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self._string_index[value] = index
+            self.strings.append(value)
+        return index
+
+    def attributes(self, attributes: Mapping[str, SysMLAttribute]) -> Tuple[int, int]:
+        rows = self.tables["attributes"]
+        start = len(rows) // _ATTRIBUTE_WIDTH
+        for attr in attributes.values():
+            if attr.type is None:
+                type_index = definition_index = _NONE
+            else:
+                type_index = self.string(attr.type.as_string())
+                definition_index = self.string(attr.type.string_definition)
+            value_index = _NONE if attr.value is None else self.string(repr(attr.value))
+            rows.extend(
+                (
+                    self.string(attr.name),
+                    type_index,
+                    definition_index,
+                    value_index,
+                    self.string(attr.doc),
+                )
+            )
+        return start, len(attributes)
+
+
+def _encode(architecture: SysMLArchitecture) -> bytes:
+    encoder = _Encoder()
+    tables = encoder.tables
+    package_index = encoder.string(architecture.package)
+    port_index = {id(port): i for i, port in enumerate(architecture.port_definitions.values())}
+    part_index = {id(part): i for i, part in enumerate(architecture.part_definitions.values())}
+
+    def lookup(index: Dict[int, int], obj: Any) -> int:
+        return _NONE if obj is None else index.get(id(obj), _NONE)
+
+    for port_def in architecture.port_definitions.values():
+        tables["port_defs"].extend(
+            (encoder.string(port_def.name), encoder.string(port_def.doc))
+            + encoder.attributes(port_def.attributes)
+        )
+
+    for part_def in architecture.part_definitions.values():
+        row = [encoder.string(part_def.name), encoder.string(part_def.doc)]
+        row.extend(encoder.attributes(part_def.attributes))
+
+        row.extend((len(tables["port_refs"]) // _PORT_REF_WIDTH, len(part_def.ports)))
+        for port in part_def.ports.values():
+            tables["port_refs"].extend(
+                (
+                    encoder.string(port.name),
+                    encoder.string(port.direction),
+                    encoder.string(port.port_name),
+                    encoder.string(port.doc),
+                    lookup(port_index, port.port_def),
+                )
+            )
+
+        row.extend((len(tables["part_refs"]) // _PART_REF_WIDTH, len(part_def.parts)))
+        for ref in part_def.parts.values():
+            tables["part_refs"].extend(
+                (
+                    encoder.string(ref.name),
+                    encoder.string(ref.part_name),
+                    encoder.string(ref.doc),
+                    lookup(part_index, ref.part_def),
+                )
+            )
+
+        row.extend(
+            (len(tables["connections"]) // _CONNECTION_WIDTH, len(part_def.connections))
+        )
+        for c in part_def.connections:
+            tables["connections"].extend(
+                (
+                    encoder.string(c.src_component),
+                    encoder.string(c.src_port),
+                    encoder.string(c.dst_component),
+                    encoder.string(c.dst_port),
+                    lookup(part_index, c.src_part_def),
+                    lookup(part_index, c.dst_part_def),
+                    lookup(port_index, c.src_port_def),
+                    lookup(port_index, c.dst_port_def),
+                )
+            )
+        tables["part_defs"].extend(row)
+
+    for req in architecture.requirements:
+        tables["requirements"].extend(
+            (encoder.string(req.identifier), encoder.string(req.text))
+        )
+
+    encoded = [s.encode("utf-8") for s in encoder.strings]
+    offsets = [0]
+    for chunk in encoded:
+        offsets.append(offsets[-1] + len(chunk))
+    blob = b"".join(encoded)
+
+    body: List[int] = list(offsets)
+    header = [_MAGIC, _LAYOUT_VERSION, package_index]
+    header += [len(encoder.strings), len(blob)]
+    for name in _TABLES:
+        header += [_HEADER_WORDS + len(body), len(tables[name]) // _WIDTHS[name]]
+        body.extend(tables[name])
+
+    words = header + body
+    return array("q", words).tobytes() + blob
+
+
+class _NonFiniteFloats(ast.NodeTransformer):
+    """`repr` writes non-finite floats as bare names, which `ast.literal_eval` rejects."""
+
+    _VALUES = {"inf": float("inf"), "nan": float("nan")}
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id in self._VALUES:
+            return ast.Constant(self._VALUES[node.id])
+        return node
+
+
+def _decode_literal(text: str) -> Any:
+    try:
+        return ast.literal_eval(text)
+    except ValueError:
+        return ast.literal_eval(_NonFiniteFloats().visit(ast.parse(text, mode="eval")))
+
+
+def _decode_type(text: str, definition: Optional[str]) -> SysMLType:
+    depth = 0
+    while text.startswith("List[") and text.endswith("]"):
+        text = text[len("List[") : -1]
+        depth += 1
+    if text == "":
+        base: Any = []
+        depth = max(depth - 1, 0)
+    else:
+        base = PrimitiveType(text)
+    for _ in range(depth):
+        base = [base]
+    return SysMLType(base, definition)
+
+
+class _SharedTables:
+    """Decoded header plus lazily materialized views over one shared block."""
+
+    def __init__(self, buffer: memoryview):
+        head = buffer[: _HEADER_WORDS * 8].cast("q")
+        if head[0] != _MAGIC or head[1] != _LAYOUT_VERSION:
+            head.release()
+            raise ValueError("Shared memory block does not contain a SysML architecture")
+        self.package_index = head[2]
+        string_count = head[3]
+        blob_size = head[4]
+        self.sections = {
+            name: (head[5 + 2 * i], head[6 + 2 * i]) for i, name in enumerate(_TABLES)
+        }
+        head.release()
+
+        word_count = _HEADER_WORDS + string_count + 1
+        word_count += sum(rows * _WIDTHS[name] for name, (_, rows) in self.sections.items())
+        self.words = buffer[: word_count * 8].cast("q")
+        self.blob = buffer[word_count * 8 : word_count * 8 + blob_size]
+        self._strings: Dict[int, str] = {}
+        self._port_defs: Dict[int, "SharedPortDefinition"] = {}
+        self._part_defs: Dict[int, "SharedPartDefinition"] = {}
+
+    def release(self) -> None:
+        self._strings.clear()
+        self._port_defs.clear()
+        self._part_defs.clear()
+        self.words.release()
+        self.blob.release()
+
+    def string(self, index: int) -> Optional[str]:
+        if index == _NONE:
+            return None
+        value = self._strings.get(index)
+        if value is None:
+            start = self.words[_HEADER_WORDS + index]
+            end = self.words[_HEADER_WORDS + index + 1]
+            value = bytes(self.blob[start:end]).decode("utf-8")
+            self._strings[index] = value
+        return value
+
+    def row(self, table: str, width: int, index: int) -> Sequence[int]:
+        offset, _ = self.sections[table]
+        start = offset + index * width
+        return self.words[start : start + width].tolist()
+
+    def rows(self, table: str) -> int:
+        return self.sections[table][1]
+
+    def port_def(self, index: int) -> Optional["SharedPortDefinition"]:
+        if index == _NONE:
+            return None
+        view = self._port_defs.get(index)
+        if view is None:
+            view = SharedPortDefinition(self, index)
+            self._port_defs[index] = view
+        return view
+
+    def part_def(self, index: int) -> Optional["SharedPartDefinition"]:
+        if index == _NONE:
+            return None
+        view = self._part_defs.get(index)
+        if view is None:
+            view = SharedPartDefinition(self, index)
+            self._part_defs[index] = view
+        return view
+
+    def attributes(self, start: int, count: int) -> Mapping[str, SysMLAttribute]:
+        attributes: Dict[str, SysMLAttribute] = {}
+        for i in range(start, start + count):
+            name, type_index, definition, value, doc = self.row(
+                "attributes", _ATTRIBUTE_WIDTH, i
+            )
+            attr_type = None
+            if type_index != _NONE:
+                attr_type = _decode_type(self.string(type_index), self.string(definition))
+            literal = None if value == _NONE else _decode_literal(self.string(value))
+            attributes[self.string(name)] = SysMLAttribute(
+                name=self.string(name), type=attr_type, value=literal, doc=self.string(doc)
+            )
+        return MappingProxyType(attributes)
+
+
+class _SharedView:
+    __slots__ = ("_tables", "_index")
+
+    def __init__(self, tables: _SharedTables, index: int):
+        self._tables = tables
+        self._index = index
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SharedView.__slots__ and not hasattr(self, name):
+            object.__setattr__(self, name, value)
+            return
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({getattr(self, 'name', self._index)!r})"
+
+
+class SharedPortDefinition(_SharedView):
+    """Read-only stand-in for `SysMLPortDefinition`."""
+
+    __slots__ = ()
+
+    def _row(self) -> Sequence[int]:
+        return self._tables.row("port_defs", _PORT_DEF_WIDTH, self._index)
+
+    @property
+    def name(self) -> str:
+        return self._tables.string(self._row()[0])
+
+    @property
+    def doc(self) -> Optional[str]:
+        return self._tables.string(self._row()[1])
+
+    @property
+    def attributes(self) -> Mapping[str, SysMLAttribute]:
+        row = self._row()
+        return self._tables.attributes(row[2], row[3])
+
+
+class SharedPortReference(_SharedView):
+    """Read-only stand-in for `SysMLPortReference`."""
+
+    __slots__ = ()
+
+    def _row(self) -> Sequence[int]:
+        return self._tables.row("port_refs", _PORT_REF_WIDTH, self._index)
+
+    name = property(lambda self: self._tables.string(self._row()[0]))
+    direction = property(lambda self: self._tables.string(self._row()[1]))
+    port_name = property(lambda self: self._tables.string(self._row()[2]))
+    doc = property(lambda self: self._tables.string(self._row()[3]))
+    port_def = property(lambda self: self._tables.port_def(self._row()[4]))
+
+
+class SharedPartReference(_SharedView):
+    """Read-only stand-in for `SysMLPartReference`."""
+
+    __slots__ = ()
+
+    def _row(self) -> Sequence[int]:
+        return self._tables.row("part_refs", _PART_REF_WIDTH, self._index)
+
+    name = property(lambda self: self._tables.string(self._row()[0]))
+    part_name = property(lambda self: self._tables.string(self._row()[1]))
+    doc = property(lambda self: self._tables.string(self._row()[2]))
+    part_def = property(lambda self: self._tables.part_def(self._row()[3]))
+
+
+class SharedConnection(_SharedView):
+    """Read-only stand-in for `SysMLConnection`."""
+
+    __slots__ = ()
+
+    def _row(self) -> Sequence[int]:
+        return self._tables.row("connections", _CONNECTION_WIDTH, self._index)
+
+    src_component = property(lambda self: self._tables.string(self._row()[0]))
+    src_port = property(lambda self: self._tables.string(self._row()[1]))
+    dst_component = property(lambda self: self._tables.string(self._row()[2]))
+    dst_port = property(lambda self: self._tables.string(self._row()[3]))
+    src_part_def = property(lambda self: self._tables.part_def(self._row()[4]))
+    dst_part_def = property(lambda self: self._tables.part_def(self._row()[5]))
+    src_port_def = property(lambda self: self._tables.port_def(self._row()[6]))
+    dst_port_def = property(lambda self: self._tables.port_def(self._row()[7]))
+
+    @property
+    def name(self) -> str:
+        return f"{self.src_component}.{self.src_port}->{self.dst_component}.{self.dst_port}"
+
+
+class SharedPartDefinition(_SharedView):
+    """Read-only stand-in for `SysMLPartDefinition`."""
+
+    __slots__ = ()
+
+    get_port_attributes = SysMLPartDefinition.get_port_attributes
+
+    def _row(self) -> Sequence[int]:
+        return self._tables.row("part_defs", _PART_DEF_WIDTH, self._index)
+
+    @property
+    def name(self) -> str:
+        return self._tables.string(self._row()[0])
+
+    @property
+    def doc(self) -> Optional[str]:
+        return self._tables.string(self._row()[1])
+
+    @property
+    def attributes(self) -> Mapping[str, SysMLAttribute]:
+        row = self._row()
+        return self._tables.attributes(row[2], row[3])
+
+    def _references(self, cls: type, start: int, count: int) -> Mapping[str, Any]:
+        refs = (cls(self._tables, i) for i in range(start, start + count))
+        return MappingProxyType({ref.name: ref for ref in refs})
+
+    @property
+    def ports(self) -> Mapping[str, SharedPortReference]:
+        row = self._row()
+        return self._references(SharedPortReference, row[4], row[5])
+
+    @property
+    def parts(self) -> Mapping[str, SharedPartReference]:
+        row = self._row()
+        return self._references(SharedPartReference, row[6], row[7])
+
+    @property
+    def connections(self) -> Tuple[SharedConnection, ...]:
+        row = self._row()
+        return tuple(
+            SharedConnection(self._tables, i) for i in range(row[8], row[8] + row[9])
+        )
+
+
+class _SharedRequirement(_SharedView):
+    __slots__ = ()
+
+    identifier = property(
+        lambda self: self._tables.string(
+            self._tables.row("requirements", _REQUIREMENT_WIDTH, self._index)[0]
+        )
+    )
+    text = property(
+        lambda self: self._tables.string(
+            self._tables.row("requirements", _REQUIREMENT_WIDTH, self._index)[1]
+        )
+    )
+
+
+class SharedArchitectureView:
+    """Read-only architecture backed by a shared memory block.
+
+    Pickling a view only transfers the block name; the receiving process re-attaches.
+    Call `close()` (or use it as a context manager) before the block is unlinked.
+    """
+
+    def __init__(self, name: str):
+        if sys.version_info >= (3, 13):
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        if sys.version_info < (3, 13) and os.name == "posix" and name not in _OWNED:
+            # Before 3.13 attaching registers the block with this process's resource
+            # tracker, which would unlink it (under the owner) when this process exits.
+            # The owner's process keeps its single registration for crash cleanup.
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        self._tables = _SharedTables(self._shm.buf)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def package(self) -> str:
+        return self._tables.string(self._tables.package_index)
+
+    @property
+    def port_definitions(self) -> Mapping[str, SharedPortDefinition]:
+        views = (self._tables.port_def(i) for i in range(self._tables.rows("port_defs")))
+        return MappingProxyType({view.name: view for view in views})
+
+    @property
+    def part_definitions(self) -> Mapping[str, SharedPartDefinition]:
+        views = (self._tables.part_def(i) for i in range(self._tables.rows("part_defs")))
+        return MappingProxyType({view.name: view for view in views})
+
+    @property
+    def requirements(self) -> Tuple[Any, ...]:
+        return tuple(
+            _SharedRequirement(self._tables, i)
+            for i in range(self._tables.rows("requirements"))
+        )
+
+    def iter_part_definitions(self) -> Iterator[SharedPartDefinition]:
+        for i in range(self._tables.rows("part_defs")):
+            yield self._tables.part_def(i)
+
+    def close(self) -> None:
+        if self._tables is not None:
+            self._tables.release()
+            self._tables = None
+            self._shm.close()
+
+    def __enter__(self) -> "SharedArchitectureView":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __reduce__(self):
+        return (attach_architecture, (self.name,))
+
+
+class SharedArchitecture:
+    """Owner of a shared memory block holding an encoded architecture.
+
+    The owner unlinks the block on `close()`; workers attach by `name`.
+    """
+
+    def __init__(self, architecture: SysMLArchitecture):
+        payload = _encode(architecture)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+        self._shm.buf[: len(payload)] = payload
+        self.size = len(payload)
+        _OWNED.add(self._shm.name)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def attach(self) -> SharedArchitectureView:
+        return attach_architecture(self.name)
+
+    def close(self) -> None:
+        if self._shm is not None:
+            _OWNED.discard(self._shm.name)
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedArchitecture":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __reduce__(self):
+        return (attach_architecture, (self.name,))
+
+
+def share_architecture(architecture: SysMLArchitecture) -> SharedArchitecture:
+    """Copy `architecture` into a new shared memory block owned by the caller."""
+    return SharedArchitecture(architecture)
+
+
+def attach_architecture(name: str) -> SharedArchitectureView:
+    """Attach to a block created by `share_architecture` and return a read-only view."""
+    return SharedArchitectureView(name)
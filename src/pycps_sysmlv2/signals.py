@@ -0,0 +1,199 @@
+"""Flat signal/connection tables: one row per payload attribute per connection.
+
+Each row describes one signal of a `connect` statement::
+
+    system, src_component, src_port, dst_component, dst_port, port_definition, attribute, type
+
+Custom (non-primitive) attribute types are written with their declared name.
+
+The payload layout of every port definition (attribute names and type strings, plus
+their pre-encoded CSV and JSON fragments) is computed once and reused for every
+connection that carries it. Each connection's leading columns are encoded once as well,
+so a written row is a single string concatenation. Writers stream rows to a text file
+in batches.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Callable, Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+
+from .definitions import SysMLArchitecture, SysMLPartDefinition, SysMLPortDefinition
+from .validation import attribute_type_name
+
+SIGNAL_COLUMNS = (
+    "system",
+    "src_component",
+    "src_port",
+    "dst_component",
+    "dst_port",
+    "port_definition",
+    "attribute",
+    "type",
+)
+
+SignalRow = Tuple[str, str, str, str, str, str, str, str]
+Source = Union[SysMLArchitecture, SysMLPartDefinition, Iterable[SysMLPartDefinition]]
+
+_BATCH_SIZE = 4096
+_CSV_LINE_END = "\r\n"  # matches csv.writer's default dialect
+# Leading columns of a record, filled per connection with pre-encoded values.
+_CSV_HEAD = ",".join(["{}"] * 5)
+_JSON_HEAD = "{{" + ", ".join(f'"{name}": {{}}' for name in SIGNAL_COLUMNS[:5])
+
+
+def _csv_field(value: str) -> str:
+    if any(char in value for char in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+class _EncodedNames(dict):
+    """Memoized per-value encoder; model names repeat across many connections."""
+
+    def __init__(self, encode: Callable[[str], str]):
+        super().__init__()
+        self._encode = encode
+
+    def __missing__(self, value: str) -> str:
+        encoded = self[value] = self._encode(value)
+        return encoded
+
+
+class _PortLayout:
+    __slots__ = ("port_def", "name", "rows", "csv_fragments", "json_fragments")
+
+    def __init__(self, port_def: SysMLPortDefinition):
+        # Held so that the id keying the builder's cache cannot be reused meanwhile.
+        self.port_def = port_def
+        self.name = port_def.name
+        self.rows: List[Tuple[str, str]] = [
+            (name, attribute_type_name(attr)) for name, attr in port_def.attributes.items()
+        ]
+        # Trailing part of each CSV/JSON Lines record, shared by every connection using
+        # port_def.
+        self.csv_fragments: List[str] = [
+            f",{_csv_field(self.name)},{_csv_field(name)},{_csv_field(type_name)}"
+            f"{_CSV_LINE_END}"
+            for name, type_name in self.rows
+        ]
+        self.json_fragments: List[str] = [
+            f', "port_definition": {json.dumps(self.name)}, "attribute": {json.dumps(name)}'
+            f', "type": {json.dumps(type_name)}}}\n'
+            for name, type_name in self.rows
+        ]
+
+
+class SignalTableBuilder:
+    """Produce signal rows, caching payload layouts per port definition."""
+
+    def __init__(self) -> None:
+        self._layouts: Dict[int, _PortLayout] = {}
+
+    def layout(self, port_def: SysMLPortDefinition) -> _PortLayout:
+        layout = self._layouts.get(id(port_def))
+        if layout is None:
+            layout = _PortLayout(port_def)
+            self._layouts[id(port_def)] = layout
+        return layout
+
+    def _connections(self, source: Source) -> Iterator[Tuple[Tuple[str, ...], _PortLayout]]:
+        """Yield (system, src_component, src_port, dst_component, dst_port), layout."""
+        for part in _parts(source):
+            for c in part.connections:
+                if c.src_port_def is None:
+                    raise ValueError(
+                        f"Port definition not resolved for connection "
+                        f"{part.name}.{c.src_component}.{c.src_port}"
+                    )
+                layout = self.layout(c.src_port_def)
+                prefix = (part.name, c.src_component, c.src_port, c.dst_component, c.dst_port)
+                yield prefix, layout
+
+    def iter_rows(self, source: Source) -> Iterator[SignalRow]:
+        for prefix, layout in self._connections(source):
+            prefix += (layout.name,)
+            for row in layout.rows:
+                yield prefix + row
+
+    def _iter_blocks(
+        self, source: Source, encode: Callable[[str], str], template: str, fragments: str
+    ) -> Iterator[List[str]]:
+        """Yield the encoded lines of each connection as one list."""
+        names = _EncodedNames(encode)
+        lookup = names.__getitem__
+        for prefix, layout in self._connections(source):
+            head = template.format(*map(lookup, prefix))
+            yield [head + fragment for fragment in getattr(layout, fragments)]
+
+    def iter_csv(self, source: Source) -> Iterator[str]:
+        for lines in self._iter_blocks(source, _csv_field, _CSV_HEAD, "csv_fragments"):
+            yield from lines
+
+    def iter_jsonl(self, source: Source) -> Iterator[str]:
+        for lines in self._iter_blocks(source, json.dumps, _JSON_HEAD, "json_fragments"):
+            yield from lines
+
+    def columns(self, source: Source) -> Dict[str, List[str]]:
+        table: Dict[str, List[str]] = {name: [] for name in SIGNAL_COLUMNS}
+        prefix_columns = [table[name] for name in SIGNAL_COLUMNS[:5]]
+        port_column = table["port_definition"]
+        attribute_column = table["attribute"]
+        type_column = table["type"]
+        for prefix, layout in self._connections(source):
+            count = len(layout.rows)
+            for column, value in zip(prefix_columns, prefix):
+                column.extend([value] * count)
+            port_column.extend([layout.name] * count)
+            attribute_column.extend(name for name, _ in layout.rows)
+            type_column.extend(type_name for _, type_name in layout.rows)
+        return table
+
+
+def _parts(source: Source) -> Iterable[SysMLPartDefinition]:
+    if isinstance(source, SysMLArchitecture):
+        return source.part_definitions.values()
+    if isinstance(source, SysMLPartDefinition):
+        return (source,)
+    return source
+
+
+def iter_signal_rows(source: Source) -> Iterator[SignalRow]:
+    """Yield one tuple per payload attribute per connection, see `SIGNAL_COLUMNS`."""
+    return SignalTableBuilder().iter_rows(source)
+
+
+def signal_columns(source: Source) -> Dict[str, List[str]]:
+    """Return the signal table as one list per column."""
+    return SignalTableBuilder().columns(source)
+
+
+def write_signal_table(
+    source: Source, stream: TextIO, format: str = "csv", header: bool = True
+) -> int:
+    """Stream the signal table to `stream` as `csv` or `jsonl`. Returns the row count.
+
+    CSV output matches `csv.writer`'s default dialect; open files with `newline=""`.
+    """
+    builder = SignalTableBuilder()
+    if format == "csv":
+        if header:
+            stream.write(",".join(SIGNAL_COLUMNS) + _CSV_LINE_END)
+        blocks = builder._iter_blocks(source, _csv_field, _CSV_HEAD, "csv_fragments")
+    elif format == "jsonl":
+        blocks = builder._iter_blocks(source, json.dumps, _JSON_HEAD, "json_fragments")
+    else:
+        raise ValueError(f"Unsupported signal table format: {format}")
+
+    count = 0
+    batch: List[str] = []
+    for lines in blocks:
+        batch += lines
+        if len(batch) >= _BATCH_SIZE:
+            stream.writelines(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        stream.writelines(batch)
+        count += len(batch)
+    return count
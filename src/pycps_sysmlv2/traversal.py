@@ -0,0 +1,125 @@
+"""Iterative traversal of the model graph and of nested values.
+
+Generated models can nest far deeper than Python's recursion limit (long part
+hierarchies, deeply nested list literals). These helpers keep their own stack, so depth
+only costs memory, and visit each node once by identity, so cyclic references are safe.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+PRE_ORDER = "pre"
+POST_ORDER = "post"
+
+
+def walk(
+    root: Any, children: Callable[[Any], Iterable[Any]], order: str = PRE_ORDER
+) -> Iterator[Any]:
+    """Depth-first walk yielding every node reachable from `root` exactly once.
+
+    `children(node)` returns the successors of a node. Nodes are identified by `id`,
+    so equal but distinct objects are all visited. The visiting order is the one of the
+    equivalent recursive walk.
+    """
+    if order not in (PRE_ORDER, POST_ORDER):
+        raise ValueError(f"Unsupported traversal order: {order}")
+    pre = order == PRE_ORDER
+    # Keep the nodes themselves so that their ids cannot be reused while walking.
+    seen: Dict[int, Any] = {id(root): root}
+    if pre:
+        yield root
+    stack: List[Tuple[Any, Iterator[Any]]] = [(root, iter(children(root)))]
+    while stack:
+        node, pending = stack[-1]
+        for child in pending:
+            if id(child) not in seen:
+                seen[id(child)] = child
+                if pre:
+                    yield child
+                stack.append((child, iter(children(child))))
+                break
+        else:
+            stack.pop()
+            if not pre:
+                yield node
+
+
+def is_model_object(value: Any) -> bool:
+    """True for instances with attributes (model classes), excluding enum members."""
+    return hasattr(value, "__dict__") and not isinstance(value, (Enum, type))
+
+
+def model_children(node: Any) -> List[Any]:
+    """Model objects directly referenced by `node`'s public attributes.
+
+    Dicts, lists, tuples and sets in between are looked through, however deeply nested.
+    """
+    found: List[Any] = []
+    stack = [
+        value for key, value in reversed(vars(node).items()) if not str(key).startswith("_")
+    ]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, (list, tuple, set)):
+            stack.extend(reversed(list(value)))
+        elif is_model_object(value):
+            found.append(value)
+    return found
+
+
+def walk_model(root: Any, order: str = PRE_ORDER) -> Iterator[Any]:
+    """Yield every model object reachable from `root` (e.g. an architecture) once."""
+    return walk(root, model_children, order)
+
+
+def _subpart_definitions(part_def: Any) -> List[Any]:
+    return [ref.part_def for ref in part_def.parts.values() if ref.part_def is not None]
+
+
+def walk_parts(part_def: Any, order: str = PRE_ORDER) -> Iterator[Any]:
+    """Yield each part definition in the hierarchy below `part_def` (inclusive) once."""
+    return walk(part_def, _subpart_definitions, order)
+
+
+def iter_part_instances(part_def: Any) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Yield ``(instance path, part definition)`` for every part instance, pre-order.
+
+    Unlike `walk_parts`, a definition used by several subparts is yielded once per
+    instance path. The root has the empty path. Subparts whose definition is already
+    an ancestor on the current path (recursive compositions) are not expanded.
+    """
+    yield (), part_def
+    active = {id(part_def)}
+    stack: List[Tuple[Tuple[str, ...], Any, Iterator[Any]]] = [
+        ((), part_def, iter(part_def.parts.values()))
+    ]
+    while stack:
+        path, node, pending = stack[-1]
+        for ref in pending:
+            child = ref.part_def
+            if child is None or id(child) in active:
+                continue
+            child_path = path + (ref.name,)
+            yield child_path, child
+            active.add(id(child))
+            stack.append((child_path, child, iter(child.parts.values())))
+            break
+        else:
+            stack.pop()
+            active.discard(id(node))
+
+
+def unwrap_first(value: Any, types: Tuple[type, ...] = (list, tuple)) -> Tuple[int, Any]:
+    """Follow first items through nested non-empty sequences.
+
+    Returns ``(depth, innermost)``, e.g. ``(2, 1)`` for ``[[1, 2], [3]]``.
+    """
+    depth = 0
+    while isinstance(value, types) and value:
+        value = value[0]
+        depth += 1
+    return depth, value
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from .traversal import unwrap_first
+
+
 def obj_base(obj):
-    if isinstance(obj, list) and obj:
-        if len(obj) == 0:
-            return None
-        return obj_base(obj[0])
-    return obj
+    """Innermost first element of nested non-empty lists (``obj`` itself otherwise)."""
+    return unwrap_first(obj, (list,))[1]
+
 
 def obj_iterator(values):
     if isinstance(values, (list, tuple)):
@@ -0,0 +1,163 @@
+"""Semantic validation passes run after reference resolution."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .definitions import (
+    SysMLArchitecture,
+    SysMLAttribute,
+    SysMLConnection,
+    SysMLPartDefinition,
+    SysMLPortDefinition,
+)
+
+# One (attribute name, type string) pair per payload attribute, sorted by name.
+PortSignature = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class SysMLConnectionIssue:
+    part: str
+    connection: SysMLConnection
+    kind: str  # "direction" or "type"
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.part}: {self.message}"
+
+
+def attribute_type_name(attr: SysMLAttribute) -> str:
+    """Type name of an attribute; custom (unknown) types keep their declared name."""
+    if attr.type is None:
+        return ""
+    if attr.type.is_unknown() and attr.type.string_definition:
+        return attr.type.string_definition.strip()
+    return attr.type.as_string()
+
+
+def port_signature(port_def: SysMLPortDefinition) -> PortSignature:
+    """Return the comparable type signature of a port definition payload."""
+    return tuple(
+        sorted(
+            (name, attribute_type_name(attr)) for name, attr in port_def.attributes.items()
+        )
+    )
+
+
+class ConnectionChecker:
+    """Check connection compatibility using cached per-port-definition signatures.
+
+    Signatures are computed once per port definition and compatibility verdicts
+    are cached per (src_port_def, dst_port_def) pair, so checking a model is
+    linear in the number of connections.
+    """
+
+    def __init__(self) -> None:
+        # Entries keep the port definitions themselves so that their ids cannot be
+        # reused by other objects while the checker is alive.
+        self._signatures: Dict[int, Tuple[SysMLPortDefinition, PortSignature]] = {}
+        self._verdicts: Dict[
+            Tuple[int, int], Tuple[SysMLPortDefinition, SysMLPortDefinition, Optional[str]]
+        ] = {}
+
+    def signature(self, port_def: SysMLPortDefinition) -> PortSignature:
+        key = id(port_def)
+        entry = self._signatures.get(key)
+        if entry is None:
+            entry = self._signatures[key] = (port_def, port_signature(port_def))
+        return entry[1]
+
+    def type_mismatch(
+        self, src: SysMLPortDefinition, dst: SysMLPortDefinition
+    ) -> Optional[str]:
+        """Return a description of the payload mismatch, or None if compatible."""
+        key = (id(src), id(dst))
+        entry = self._verdicts.get(key)
+        if entry is not None:
+            return entry[2]
+
+        verdict: Optional[str] = None
+        if src is not dst:
+            src_sig = self.signature(src)
+            dst_sig = self.signature(dst)
+            if src_sig != dst_sig:
+                src_types = dict(src_sig)
+                dst_types = dict(dst_sig)
+                missing = sorted(set(src_types) - set(dst_types))
+                extra = sorted(set(dst_types) - set(src_types))
+                changed = sorted(
+                    f"{name} ({src_types[name]} vs {dst_types[name]})"
+                    for name in set(src_types) & set(dst_types)
+                    if src_types[name] != dst_types[name]
+                )
+                details = []
+                if missing:
+                    details.append(f"missing in {dst.name}: {', '.join(missing)}")
+                if extra:
+                    details.append(f"unexpected in {dst.name}: {', '.join(extra)}")
+                if changed:
+                    details.append(f"type differs: {', '.join(changed)}")
+                verdict = f"{src.name} -> {dst.name} ({'; '.join(details)})"
+        self._verdicts[key] = (src, dst, verdict)
+        return verdict
+
+    def check_part(self, part: SysMLPartDefinition) -> List[SysMLConnectionIssue]:
+        issues: List[SysMLConnectionIssue] = []
+        for c in part.connections:
+            if c.src_part_def is None or c.dst_part_def is None:
+                continue
+
+            src_ref = c.src_part_def.ports.get(c.src_port)
+            dst_ref = c.dst_part_def.ports.get(c.dst_port)
+            endpoints = f"{c.src_component}.{c.src_port} to {c.dst_component}.{c.dst_port}"
+            if src_ref is not None and src_ref.direction != "out":
+                issues.append(
+                    SysMLConnectionIssue(
+                        part.name,
+                        c,
+                        "direction",
+                        f"Connection source is not an out port: {endpoints}",
+                    )
+                )
+            if dst_ref is not None and dst_ref.direction != "in":
+                issues.append(
+                    SysMLConnectionIssue(
+                        part.name,
+                        c,
+                        "direction",
+                        f"Connection destination is not an in port: {endpoints}",
+                    )
+                )
+
+            if c.src_port_def is None or c.dst_port_def is None:
+                continue
+            mismatch = self.type_mismatch(c.src_port_def, c.dst_port_def)
+            if mismatch is not None:
+                issues.append(
+                    SysMLConnectionIssue(
+                        part.name,
+                        c,
+                        "type",
+                        f"Incompatible port types for {endpoints}: {mismatch}",
+                    )
+                )
+        return issues
+
+    def check(self, parts: Iterable[SysMLPartDefinition]) -> List[SysMLConnectionIssue]:
+        issues: List[SysMLConnectionIssue] = []
+        for part in parts:
+            issues.extend(self.check_part(part))
+        return issues
+
+
+def validate_connections(architecture: SysMLArchitecture) -> List[SysMLConnectionIssue]:
+    """Return all direction and type mismatches across the architecture's connections."""
+    return ConnectionChecker().check(architecture.part_definitions.values())
+
+
+def raise_for_issues(issues: List[SysMLConnectionIssue]) -> None:
+    if issues:
+        summary = "\n".join(f"  - {issue}" for issue in issues)
+        raise ValueError(f"{len(issues)} incompatible connection(s):\n{summary}")
@@ -0,0 +1,324 @@
+"""Watch a SysML folder and reload the architecture when `.sysml` files change.
+
+`SysMLFolderWatcher` keeps the per-file parse results of the folder. A reload re-parses
+only added and modified files, drops removed ones and re-links the merged set, then
+notifies subscribers with an `ArchitectureChange`.
+
+Change detection is a stat scan (size and mtime of every `.sysml` file). `poll()` runs
+one scan synchronously; `start()` runs a background thread that sleeps on inotify
+where available (Linux, through ctypes) and otherwise re-scans every `poll_interval`
+seconds. Bursts of saves are debounced: a reload starts once the folder has been quiet
+for `debounce` seconds.
+
+Delivered architectures are snapshots that never change afterwards. Unchanged files
+keep their parsed objects only while every name they reference still resolves to the
+same definition; files referring to a re-parsed or removed definition are re-parsed
+too, so re-linking never rewrites references that an earlier architecture holds.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from .cache import folder_fingerprint
+from .definitions import SysMLArchitecture
+from .parsing import _ParsedFile, _link_files, _parse_file
+
+# path -> (size in bytes, modification time in ns)
+Snapshot = Dict[Path, Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class ArchitectureChange:
+    """A successful reload: the new architecture and what differs from the last one."""
+
+    architecture: SysMLArchitecture
+    added: FrozenSet[Path]
+    modified: FrozenSet[Path]
+    removed: FrozenSet[Path]
+    # Names of part/port definitions whose source block was added, removed or edited.
+    definitions: FrozenSet[str]
+
+
+Subscriber = Callable[[ArchitectureChange], None]
+
+
+class SysMLFolderWatcher:
+    """Incrementally reload a folder's architecture and notify subscribers.
+
+    The folder is parsed once on construction, raising like `load_architecture`.
+    Failed reloads (e.g. a file saved mid-edit) keep the previous architecture, are
+    stored in `error` and passed to `on_error`; the same snapshot is not retried.
+    """
+
+    def __init__(
+        self,
+        folder: Path | str,
+        debounce: float = 0.2,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        self.folder = Path(folder)
+        if not self.folder.is_dir():
+            raise FileNotFoundError(f"SysML folder not found: {self.folder}")
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.on_error = on_error
+        self.error: Optional[Exception] = None
+
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscriber] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self._snapshot = self._scan()
+        if not self._snapshot:
+            raise FileNotFoundError(f"No .sysml files found under {self.folder}")
+        self._failed: Optional[Snapshot] = None
+        self._files: Dict[Path, _ParsedFile] = {
+            path: _parse_file(path) for path in sorted(self._snapshot)
+        }
+        self._architecture = _link_files(list(self._files.values()))
+
+    @property
+    def architecture(self) -> SysMLArchitecture:
+        return self._architecture
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Register `callback` for future changes; returns a function to unsubscribe."""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def _scan(self) -> Snapshot:
+        return {
+            self.folder / name: (size, mtime)
+            for name, size, mtime in folder_fingerprint(self.folder)
+        }
+
+    def poll(self) -> Optional[ArchitectureChange]:
+        """Scan the folder once and reload if files changed since the last reload."""
+        with self._lock:
+            snapshot = self._scan()
+            if snapshot == self._snapshot or snapshot == self._failed:
+                return None
+            try:
+                change = self._reload(snapshot)
+            except (OSError, ValueError) as exc:
+                self._failed = snapshot
+                self.error = exc
+                change = None
+        if change is None:
+            if self.on_error is not None:
+                self.on_error(self.error)
+            return None
+        for callback in list(self._subscribers):
+            callback(change)
+        return change
+
+    def _reload(self, snapshot: Snapshot) -> ArchitectureChange:
+        previous = self._snapshot
+        added = snapshot.keys() - previous.keys()
+        removed = previous.keys() - snapshot.keys()
+        modified = {
+            path for path in snapshot.keys() & previous.keys()
+            if snapshot[path] != previous[path]
+        }
+        if not snapshot:
+            raise FileNotFoundError(f"No .sysml files found under {self.folder}")
+
+        files = {path: parsed for path, parsed in self._files.items() if path in snapshot}
+        for path in sorted(added | modified):
+            files[path] = _parse_file(path)
+        self._reparse_dependents(files, added | modified, removed)
+        architecture = _link_files([files[path] for path in sorted(files)])
+
+        old_blocks: Dict[Tuple[str, str], str] = {}
+        new_blocks: Dict[Tuple[str, str], str] = {}
+        for path in removed | modified:
+            old_blocks.update(self._files[path].blocks)
+        for path in added | modified:
+            new_blocks.update(files[path].blocks)
+        definitions = frozenset(
+            name
+            for keyword, name in old_blocks.keys() | new_blocks.keys()
+            if old_blocks.get((keyword, name)) != new_blocks.get((keyword, name))
+        )
+
+        self._files = files
+        self._snapshot = snapshot
+        self._failed = None
+        self.error = None
+        self._architecture = architecture
+        return ArchitectureChange(
+            architecture=architecture,
+            added=frozenset(added),
+            modified=frozenset(modified),
+            removed=frozenset(removed),
+            definitions=definitions,
+        )
+
+    def _reparse_dependents(
+        self, files: Dict[Path, _ParsedFile], fresh: Set[Path], removed: Set[Path]
+    ) -> None:
+        """Re-parse kept files that reference a definition that is new or gone.
+
+        Their references would otherwise be re-linked in place, changing the graph of
+        the architecture delivered before. Repeats until no kept file depends on a
+        re-parsed one.
+        """
+        stale: Set[str] = set()
+        for path in removed:
+            stale.update(_defined_names(self._files[path]))
+        parsed_paths = set(fresh)
+        pending = set(fresh)
+        while pending:
+            for path in pending:
+                stale.update(_defined_names(files[path]))
+            pending = {
+                path
+                for path, parsed in files.items()
+                if path not in parsed_paths and not stale.isdisjoint(_referenced_names(parsed))
+            }
+            parsed_paths |= pending
+            for path in pending:
+                files[path] = _parse_file(path)
+
+    def start(self) -> None:
+        """Watch in a daemon thread until `stop()` is called."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        waiter = None
+        if self.use_inotify:
+            waiter = _InotifyWaiter.create(self.folder)
+        if waiter is None:
+            waiter = _PollingWaiter(self._scan, self._stop, self._snapshot)
+        self._thread = threading.Thread(
+            target=self._run, args=(waiter,), name="sysml-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join()
+        self._thread = None
+
+    def _run(self, waiter: _PollingWaiter | _InotifyWaiter) -> None:
+        try:
+            while not self._stop.is_set():
+                if not waiter.wait(self.poll_interval):
+                    continue
+                # Debounce: keep waiting while changes keep arriving.
+                while not self._stop.is_set() and waiter.wait(self.debounce):
+                    pass
+                if not self._stop.is_set():
+                    self.poll()
+        finally:
+            waiter.close()
+
+    def __enter__(self) -> SysMLFolderWatcher:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def _defined_names(parsed: _ParsedFile) -> List[str]:
+    return [*parsed.part_definitions, *parsed.port_definitions]
+
+
+def _referenced_names(parsed: _ParsedFile) -> Set[str]:
+    """Definition names the file's references are linked to by name."""
+    names: Set[str] = set()
+    for part in parsed.part_definitions.values():
+        names.update(port.port_name for port in part.ports.values())
+        names.update(ref.part_name for ref in part.parts.values())
+    return names
+
+
+class _PollingWaiter:
+    """Sleep, then report whether the stat snapshot moved since the last call."""
+
+    def __init__(self, scan: Callable[[], Snapshot], stop: threading.Event, last: Snapshot):
+        self._scan = scan
+        self._stop = stop
+        self._last = last
+
+    def wait(self, timeout: float) -> bool:
+        if self._stop.wait(timeout):
+            return False
+        snapshot = self._scan()
+        changed = snapshot != self._last
+        self._last = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+# inotify(7) event masks relevant to files being written, created, moved or deleted.
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE
+)
+
+
+class _InotifyWaiter:
+    """Block on an inotify descriptor; events only wake the watcher, which then scans."""
+
+    def __init__(self, fd: int):
+        self._fd = fd
+
+    @classmethod
+    def create(cls, folder: Path) -> Optional[_InotifyWaiter]:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        except (OSError, AttributeError):
+            return None
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(folder), _WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def wait(self, timeout: float) -> bool:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
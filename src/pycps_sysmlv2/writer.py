@@ -0,0 +1,241 @@
+"""Write a `SysMLArchitecture` back out as `.sysml` text that parses to the same graph.
+
+Each definition is rendered from statement templates into one string, and writers emit
+those strings in batches, so output cost is linear in model size. Large models can be
+sharded across several files of one package; `load_architecture` on the target folder
+reads them back in order.
+
+Round-trip notes:
+
+- Attributes with a value are written as literals (`true`/`false`, Python literal
+  syntax otherwise); their type is re-inferred from the value on parsing. Attributes
+  without a value keep their declared type (`attribute x : Real;`).
+- Docs and requirement texts are written on one line, so runs of whitespace collapse
+  as they do when parsing.
+- Requirements scoped to a definition (see `SysMLRequirementIndex.scope_of`) are
+  written inside that definition; the others at package level.
+- Values that the parser cannot read back (braces or comment markers inside
+  literals, `*/` in docs, non-finite floats, a documented first member of an
+  undocumented definition) raise `ValueError`.
+"""
+
+from __future__ import annotations
+
+import math
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .definitions import (
+    SysMLArchitecture,
+    SysMLAttribute,
+    SysMLPartDefinition,
+    SysMLPortDefinition,
+    SysMLRequirement,
+)
+from .parser_utils import whitespace_re
+
+_BATCH_SIZE = 1024
+_INDENT = "  "
+_MEMBER = _INDENT * 2
+
+
+def _one_line(text: str, what: str) -> str:
+    if "*/" in text:
+        raise ValueError(f"Cannot write {what}: text contains '*/'")
+    return whitespace_re().sub(" ", text.strip())
+
+
+def _literal(value: Any, what: str) -> str:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"Cannot write {what}: non-finite value {value!r}")
+    text = repr(value)
+    if "{" in text or "}" in text or "/*" in text or "*/" in text:
+        raise ValueError(f"Cannot write {what}: literal {text} contains braces or comments")
+    return text
+
+
+def _attribute_line(attr: SysMLAttribute, owner: str) -> str:
+    if attr.value is not None:
+        return f"attribute {attr.name} = {_literal(attr.value, f'{owner}.{attr.name}')};"
+    if attr.type is None:
+        return f"attribute {attr.name};"
+    if attr.type.is_unknown() and attr.type.string_definition:
+        return f"attribute {attr.name} : {attr.type.string_definition};"
+    if isinstance(attr.type.type, list):
+        raise ValueError(f"Cannot write {owner}.{attr.name}: list types need a value")
+    return f"attribute {attr.name} : {attr.type.as_string()};"
+
+
+def _write_batched(stream: TextIO, chunks: Iterable[str]) -> None:
+    batch: List[str] = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) >= _BATCH_SIZE:
+            stream.writelines(batch)
+            batch = []
+    stream.writelines(batch)
+
+
+class SysMLWriter:
+    """Render the definitions, requirements and package of one architecture."""
+
+    def __init__(self, architecture: SysMLArchitecture):
+        self.architecture = architecture
+        scopes = architecture._requirement_scopes
+        self._scoped: Dict[str, List[SysMLRequirement]] = {}
+        self._package_requirements: List[SysMLRequirement] = []
+        for req in architecture.requirements:
+            scope = scopes.get(req.identifier)
+            if scope is None:
+                self._package_requirements.append(req)
+            else:
+                self._scoped.setdefault(scope, []).append(req)
+
+    @staticmethod
+    def _requirement_lines(requirements: Iterable[SysMLRequirement], indent: str) -> List[str]:
+        return [
+            f"{indent}comment {req.identifier} /* "
+            f"{_one_line(req.text, f'requirement {req.identifier}')} */\n"
+            for req in requirements
+        ]
+
+    def _definition(
+        self, keyword: str, definition: Any, members: List[Tuple[Optional[str], str]]
+    ) -> List[str]:
+        """Render a header, doc and (doc, statement) members of one definition."""
+        name = definition.name
+        lines = [f"{_INDENT}{keyword} {name} {{\n"]
+        if definition.doc is not None:
+            lines.append(f"{_MEMBER}doc /* {_one_line(definition.doc, f'doc of {name}')} */\n")
+        elif members and members[0][0] is not None:
+            # The parser would read the first member's doc as the definition's doc.
+            raise ValueError(
+                f"Cannot write {name}: the first member is documented but the definition is not"
+            )
+        for doc, line in members:
+            if doc is not None:
+                lines.append(f"{_MEMBER}doc /* {_one_line(doc, f'doc in {name}')} */\n")
+            lines.append(f"{_MEMBER}{line}\n")
+        return lines
+
+    def port_definition(self, port_def: SysMLPortDefinition) -> str:
+        name = port_def.name
+        members = [
+            (attr.doc, _attribute_line(attr, name)) for attr in port_def.attributes.values()
+        ]
+        lines = self._definition("port def", port_def, members)
+        lines += self._requirement_lines(self._scoped.get(name, ()), _MEMBER)
+        lines.append(f"{_INDENT}}}\n")
+        return "".join(lines)
+
+    def part_definition(self, part_def: SysMLPartDefinition) -> str:
+        name = part_def.name
+        kinds = [
+            [(a.doc, _attribute_line(a, name)) for a in part_def.attributes.values()],
+            [
+                (p.doc, f"{p.direction} port {p.name} : {p.port_name};")
+                for p in part_def.ports.values()
+            ],
+            [(p.doc, f"part {p.name} : {p.part_name};") for p in part_def.parts.values()],
+        ]
+        if part_def.doc is None:
+            # Attributes, ports and parts are kept in separate dicts, so only the order
+            # within a kind matters: lead with a kind whose first member has no doc.
+            kinds.sort(key=lambda members: bool(members) and members[0][0] is not None)
+        members = [member for members in kinds for member in members]
+        lines = self._definition("part def", part_def, members)
+        for c in part_def.connections:
+            lines.append(
+                f"{_MEMBER}connect {c.src_component}.{c.src_port} "
+                f"to {c.dst_component}.{c.dst_port};\n"
+            )
+        # Placed last: a comment statement would drop a pending member doc.
+        lines += self._requirement_lines(self._scoped.get(name, ()), _MEMBER)
+        lines.append(f"{_INDENT}}}\n")
+        return "".join(lines)
+
+    def iter_definitions(self) -> Iterator[str]:
+        """Yield one rendered block per definition: port definitions, then parts."""
+        for port_def in self.architecture.port_definitions.values():
+            yield self.port_definition(port_def)
+        for part_def in self.architecture.part_definitions.values():
+            yield self.part_definition(part_def)
+
+    def iter_package(
+        self, blocks: Iterable[str], package_requirements: bool = True
+    ) -> Iterator[str]:
+        """Wrap definition blocks in the package declaration."""
+        yield f"package {self.architecture.package} {{\n"
+        if package_requirements:
+            yield from self._requirement_lines(self._package_requirements, _INDENT)
+        for block in blocks:
+            yield "\n"
+            yield block
+        yield "}\n"
+
+    def write(self, stream: TextIO) -> None:
+        _write_batched(stream, self.iter_package(self.iter_definitions()))
+
+    def write_folder(
+        self, folder: Path | str, shard_size: Optional[int] = None, stem: Optional[str] = None
+    ) -> List[Path]:
+        """Write `<stem>.sysml`, or `<stem>_0001.sysml`, ... with at most `shard_size`
+        definitions each. Package-level requirements go to the first file.
+
+        Other `.sysml` files already in `folder` are left alone and would be parsed
+        together with the written ones.
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        stem = stem or self.architecture.package
+        if shard_size is None:
+            path = folder / f"{stem}.sysml"
+            with path.open("w") as handle:
+                self.write(handle)
+            return [path]
+        if shard_size < 1:
+            raise ValueError(f"shard_size must be positive, got {shard_size}")
+
+        total = len(self.architecture.port_definitions) + len(
+            self.architecture.part_definitions
+        )
+        shards = max(1, -(-total // shard_size))
+        width = max(4, len(str(shards)))
+        definitions = self.iter_definitions()
+        paths = []
+        for index in range(shards):
+            path = folder / f"{stem}_{index + 1:0{width}d}.sysml"
+            blocks = islice(definitions, shard_size)
+            with path.open("w") as handle:
+                _write_batched(handle, self.iter_package(blocks, index == 0))
+            paths.append(path)
+        return paths
+
+
+def iter_sysml(architecture: SysMLArchitecture) -> Iterator[str]:
+    """Yield the `.sysml` text of `architecture` in chunks (about one per definition)."""
+    writer = SysMLWriter(architecture)
+    return writer.iter_package(writer.iter_definitions())
+
+
+def to_sysml(architecture: SysMLArchitecture) -> str:
+    return "".join(iter_sysml(architecture))
+
+
+def write_sysml(architecture: SysMLArchitecture, stream: TextIO) -> None:
+    SysMLWriter(architecture).write(stream)
+
+
+def write_architecture(
+    architecture: SysMLArchitecture,
+    folder: Path | str,
+    shard_size: Optional[int] = None,
+    stem: Optional[str] = None,
+) -> List[Path]:
+    """Write `architecture` into `folder`, optionally sharded; returns the files."""
+    return SysMLWriter(architecture).write_folder(folder, shard_size, stem)
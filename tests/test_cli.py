@@ -0,0 +1,91 @@
+import json
+import pickle
+from pathlib import Path
+
+from pycps_sysmlv2.cache import ArchitectureDiskCache, load_architecture_cached
+from pycps_sysmlv2.cli import main
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+
+
+def test_parse_uses_disk_cache_on_second_run(tmp_path: Path, capsys):
+    args = ["parse", str(FIXTURE_ARCH_DIR), "--cache-dir", str(tmp_path)]
+    assert main(args) == 0
+    assert "cached=no" in capsys.readouterr().out
+    assert main(args) == 0
+    assert "cached=yes" in capsys.readouterr().out
+
+
+def test_disk_cache_is_invalidated_when_files_change(tmp_path: Path):
+    model = tmp_path / "model"
+    model.mkdir()
+    (model / "a.sysml").write_text("package P {\n  part def A {}\n}\n")
+
+    _, hit = load_architecture_cached(model, tmp_path / "cache")
+    assert not hit
+    _, hit = load_architecture_cached(model, tmp_path / "cache")
+    assert hit
+
+    (model / "b.sysml").write_text("package P {\n  part def B {}\n}\n")
+    architecture, hit = load_architecture_cached(model, tmp_path / "cache")
+    assert not hit
+    assert set(architecture.part_definitions) == {"A", "B"}
+    assert ArchitectureDiskCache(tmp_path / "cache").load(model) is not None
+
+
+def test_stats_and_validate_accept_many_folders_in_parallel(tmp_path: Path, capsys):
+    folders = [str(FIXTURE_ARCH_DIR)] * 2
+    assert main(["stats", *folders, "--jobs", "2", "--no-cache"]) == 0
+    out = capsys.readouterr().out
+    assert out.count("connections=5") == 2
+
+    assert main(["validate", *folders, "--no-cache"]) == 0
+    assert main(["validate", str(tmp_path / "missing"), "--no-cache"]) == 1
+
+
+def test_export_writes_json_and_binary(tmp_path: Path):
+    folder = str(FIXTURE_ARCH_DIR)
+    assert main(["export", folder, "--format", "json", "-o", str(tmp_path), "--no-cache"]) == 0
+    assert main(["export", folder, "--format", "binary", "-o", str(tmp_path), "--no-cache"]) == 0
+
+    exported = json.loads((tmp_path / "aircraft_subset.json").read_text())
+    assert exported["package"] == "Aircraft"
+    with (tmp_path / "aircraft_subset.pickle").open("rb") as handle:
+        architecture = pickle.load(handle)
+    assert "AircraftComposition" in architecture.part_definitions
+
+
+def test_bench_reports_timings(capsys):
+    assert main(["bench", str(FIXTURE_ARCH_DIR), "--repeat", "2"]) == 0
+    assert "runs=2" in capsys.readouterr().out
+
+
+def test_export_names_come_from_resolved_folders(tmp_path: Path, monkeypatch):
+    other = tmp_path / "other" / "aircraft_subset"
+    other.mkdir(parents=True)
+    (other / "a.sysml").write_text("package Other {\n  part def A {}\n}\n")
+    out = tmp_path / "out"
+
+    monkeypatch.chdir(FIXTURE_ARCH_DIR)
+    args = [".", str(FIXTURE_ARCH_DIR / "composition.sysml"), str(other)]
+    assert main(["export", *args, "-o", str(out), "--no-cache"]) == 0
+
+    assert sorted(path.name for path in out.iterdir()) == [
+        "aircraft_subset-2.json",
+        "aircraft_subset-3.json",
+        "aircraft_subset.json",
+    ]
+    assert json.loads((out / "aircraft_subset-3.json").read_text())["package"] == "Other"
+
+
+def test_unwritable_cache_directory_does_not_fail_the_run(tmp_path: Path, capsys):
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")
+    assert main(["parse", str(FIXTURE_ARCH_DIR), "--cache-dir", str(blocker)]) == 0
+    assert "cached=no" in capsys.readouterr().out
+
+    out = tmp_path / "file"
+    out.write_text("")
+    assert main(["export", str(FIXTURE_ARCH_DIR), "-o", str(out), "--no-cache"]) == 1
+    assert "error:" in capsys.readouterr().err
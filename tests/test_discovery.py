@@ -0,0 +1,128 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import load_architecture, load_system
+from pycps_sysmlv2.cache import cache_info, clear_cache, folder_fingerprint
+from pycps_sysmlv2.discovery import discover_sysml_files
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content.strip() + "\n")
+
+
+@pytest.fixture
+def roots(tmp_path: Path):
+    model = tmp_path / "model"
+    library = tmp_path / "library"
+    _write(
+        model / "system.sysml",
+        """
+package Vehicle {
+  part def System {
+    part engine : Engine;
+    part ecu : Controller;
+    connect ecu.command to engine.command;
+  }
+}
+""",
+    )
+    _write(
+        model / "powertrain" / "engine.sysml",
+        """
+package Vehicle {
+  part def Engine {
+    in port command : Command;
+  }
+}
+""",
+    )
+    _write(
+        model / "powertrain" / "drafts" / "engine_v2.sysml",
+        "package Vehicle {\n  part def Engine {}\n}",
+    )
+    _write(
+        library / "control" / "controller.sysml",
+        """
+package Vehicle {
+  port def Command {
+    attribute torque : Real;
+  }
+  part def Controller {
+    out port command : Command;
+  }
+}
+""",
+    )
+    _write(library / "control" / "notes.txt", "not a model")
+    return model, library
+
+
+def test_recursive_discovery_with_filters(roots):
+    model, library = roots
+    assert discover_sysml_files(model) == [model / "system.sysml"]
+    assert discover_sysml_files(model, recursive=True) == [
+        model / "powertrain" / "drafts" / "engine_v2.sysml",
+        model / "powertrain" / "engine.sysml",
+        model / "system.sysml",
+    ]
+    assert discover_sysml_files(model, recursive=True, exclude="drafts") == [
+        model / "powertrain" / "engine.sysml",
+        model / "system.sysml",
+    ]
+    # Overlapping roots list each file once.
+    files = discover_sysml_files(
+        [model, library, library / "control"],
+        recursive=True,
+        include=["powertrain/*", "*controller*"],
+    )
+    assert files == [
+        model / "powertrain" / "drafts" / "engine_v2.sysml",
+        model / "powertrain" / "engine.sysml",
+        library / "control" / "controller.sysml",
+    ]
+
+
+def test_load_architecture_merges_roots(roots):
+    model, library = roots
+    architecture = load_architecture([model, library], recursive=True, exclude="drafts")
+    assert architecture.package == "Vehicle"
+    assert set(architecture.part_definitions) == {"System", "Engine", "Controller"}
+    connection = architecture.part_definitions["System"].connections[0]
+    assert connection.src_port_def is architecture.port_definitions["Command"]
+
+    system = load_system([model, library], "System", recursive=True, exclude="drafts")
+    assert system.parts["engine"].part_def.ports["command"].port_name == "Command"
+
+    with pytest.raises(ValueError, match="Duplicate part definition for Engine"):
+        load_architecture([model, library], recursive=True)
+    with pytest.raises(ValueError, match="Port definition not found"):
+        load_architecture(model, recursive=True, exclude="drafts")
+
+    _write(library / "other.sysml", "package Other {\n  part def Spare {}\n}")
+    with pytest.raises(ValueError, match="Mismatched package names"):
+        load_architecture([model, library], recursive=True, exclude="drafts")
+
+
+def test_cache_fingerprint_covers_nested_files(roots):
+    model, library = roots
+    assert [name for name, _, _ in folder_fingerprint(library, recursive=True)] == [
+        "control/controller.sysml"
+    ]
+
+    clear_cache()
+    options = dict(recursive=True, exclude=["drafts"], cache=True)
+    first = load_architecture([model, library], **options)
+    assert load_architecture([model, library], **options) is first
+
+    engine = model / "powertrain" / "engine.sysml"
+    engine.write_text(engine.read_text().replace("{\n    in", "{\n    attribute rpm = 0;\n    in"))
+    stat = engine.stat()
+    os.utime(engine, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_architecture([model, library], **options)
+    assert second is not first
+    assert "rpm" in second.part_definitions["Engine"].attributes
+    assert (cache_info().hits, cache_info().misses) == (1, 2)
+    clear_cache()
@@ -0,0 +1,104 @@
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import load_architecture
+from pycps_sysmlv2.events import (
+    SysMLEventKind,
+    build_architecture,
+    iter_events,
+    iter_file_events,
+)
+from pycps_sysmlv2.parser_utils import json_dumps
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+
+
+def _write(path: Path, content: str) -> None:
+    path.write_text(content.strip() + "\n")
+
+
+def test_event_counts_for_fixture():
+    counts = Counter(event.kind for event in iter_events(FIXTURE_ARCH_DIR))
+    assert counts[SysMLEventKind.START_PACKAGE] == 4
+    assert counts[SysMLEventKind.START_PART_DEF] == 4
+    assert counts[SysMLEventKind.END_PORT_DEF] == 5
+    assert counts[SysMLEventKind.CONNECTION] == 5
+    assert counts[SysMLEventKind.REQUIREMENT] == 2
+
+
+QUOTED_MODEL = """
+package Example {
+  part def Sensor {
+    attribute label = "a;b";
+    attribute note = 'x // y; z';
+    attribute rate = 10;
+  }
+}
+"""
+
+
+@pytest.mark.parametrize("chunk_size", [3, 64, 1 << 16])
+def test_built_architecture_matches_folder_parser(tmp_path: Path, chunk_size):
+    _write(tmp_path / "model.sysml", QUOTED_MODEL)
+    for folder in (FIXTURE_ARCH_DIR, tmp_path):
+        streamed = build_architecture(iter_events(folder, chunk_size=chunk_size))
+        parsed = load_architecture(folder)
+        assert json_dumps(streamed, []) == json_dumps(parsed, [])
+
+    attributes = streamed.part_definitions["Sensor"].attributes
+    assert attributes["label"].value == "a;b"
+    assert list(attributes) == ["label", "note", "rate"]
+
+
+def test_member_events_carry_docs_scope_and_parsed_elements(tmp_path: Path):
+    _write(
+        tmp_path / "model.sysml",
+        """
+        package Example {
+          part def Sensor {
+            doc /* Sensor definition. */
+            attribute gain = 2.5; /* inline note */
+            doc /* Measured
+                   value. */
+            out port value : Reading;
+            comment REQ_1 /* Sample at 10 Hz. */
+          }
+        }
+        """,
+    )
+    events = list(iter_file_events(tmp_path / "model.sysml", chunk_size=5))
+    kinds = [event.kind for event in events]
+    assert kinds == [
+        SysMLEventKind.START_PACKAGE,
+        SysMLEventKind.START_PART_DEF,
+        SysMLEventKind.DOC,
+        SysMLEventKind.ATTRIBUTE,
+        SysMLEventKind.PORT,
+        SysMLEventKind.REQUIREMENT,
+        SysMLEventKind.END_PART_DEF,
+        SysMLEventKind.END_PACKAGE,
+    ]
+    assert events[2].element == "Sensor definition."
+    assert events[3].element.value == 2.5
+    assert events[4].element.doc == "Measured value."
+    assert events[5].element.identifier == "REQ_1"
+    assert events[5].scope == "Sensor"
+
+
+def test_unterminated_comment_fails_with_path(tmp_path: Path):
+    _write(tmp_path / "model.sysml", "package Example {\n  part def A {\n    doc /* open")
+    with pytest.raises(ValueError, match="Unterminated comment in .*model.sysml"):
+        list(iter_events(tmp_path))
+
+    _write(tmp_path / "model.sysml", 'package Example {\n  part def A {\n    attribute s = "open;')
+    with pytest.raises(ValueError, match="Unterminated string in .*model.sysml"):
+        list(iter_events(tmp_path))
+
+
+def test_missing_package_fails_with_path(tmp_path: Path):
+    _write(tmp_path / "model.sysml", "part def A {}")
+    with pytest.raises(ValueError, match="No package declaration found in"):
+        list(iter_events(tmp_path))
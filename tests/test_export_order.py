@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from pycps_sysmlv2 import (
+    SysMLArchitecture,
+    SysMLPartDefinition,
+    SysMLPartReference,
+    load_architecture,
+)
+from pycps_sysmlv2.parser_utils import json_dumps
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+FIXTURE_REFERENCE_JSON = FIXTURE_ARCH_DIR / "architecture_reference.json"
+
+
+def test_part_definitions_keep_insertion_order_but_export_sorted():
+    leaf = SysMLPartDefinition("Leaf")
+    system = SysMLPartDefinition(
+        "System", parts={"leaf": SysMLPartReference("leaf", "Leaf", part_def=leaf)}
+    )
+    alpha = SysMLPartDefinition("Alpha")
+    part_defs = {"System": system, "Leaf": leaf, "Alpha": alpha}
+    architecture = SysMLArchitecture("Example", part_definitions=part_defs)
+
+    assert architecture.part_definitions is part_defs
+    assert list(architecture.part_definitions) == ["System", "Leaf", "Alpha"]
+    assert list(architecture.ordered_part_definitions()) == ["Alpha", "Leaf", "System"]
+    assert architecture.ordered_part_definitions() is architecture.ordered_part_definitions()
+
+    exported = json_dumps(architecture, [])
+    assert exported.index('"name": "Leaf"') < exported.index('"part_name": "Leaf"')
+    assert "_ordered_parts" not in exported
+
+    # Mutations invalidate the cached view.
+    alpha.parts["leaf"] = SysMLPartReference("leaf", "Leaf", part_def=leaf)
+    assert list(architecture.ordered_part_definitions()) == ["Leaf", "Alpha", "System"]
+    del architecture.part_definitions["Leaf"]
+    assert list(architecture.ordered_part_definitions()) == ["Alpha", "System"]
+
+
+def test_fixture_export_is_unchanged():
+    architecture = load_architecture(FIXTURE_ARCH_DIR)
+    assert list(architecture.part_definitions)[0] == "AircraftComposition"  # parse order
+    assert list(architecture.ordered_part_definitions())[-1] == "AircraftComposition"
+    assert json_dumps(architecture, []) == FIXTURE_REFERENCE_JSON.read_text()
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pycps_sysmlv2
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def _import_profile(statement: str, module: str = "pycps_sysmlv2") -> tuple:
+    """Run `statement` under `python -X importtime`.
+
+    Returns the cumulative microseconds reported for `module` and the set of
+    modules loaded afterwards (taken from `sys.modules`, since modules imported via
+    `importlib.import_module` are not listed by `-X importtime`).
+    """
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=SRC_DIR,
+    )
+    cumulative = None
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            cumulative = int(line.split("|")[1])
+    return cumulative, set(completed.stdout.split())
+
+
+def test_package_import_does_not_load_parser_or_json():
+    cumulative, loaded = _import_profile("import pycps_sysmlv2")
+    assert cumulative is not None
+    assert not loaded & {
+        "pycps_sysmlv2.parsing",
+        "pycps_sysmlv2.definitions",
+        "pycps_sysmlv2.parser_utils",
+        "json",
+        "ast",
+        "dataclasses",
+        "typing",
+    }
+
+
+def test_type_import_does_not_load_parser():
+    _, loaded = _import_profile("from pycps_sysmlv2 import SysMLType")
+    assert "pycps_sysmlv2.definitions" in loaded
+    assert not loaded & {"pycps_sysmlv2.parsing", "json"}
+
+
+def test_loader_import_does_not_load_optional_stages():
+    _, loaded = _import_profile("from pycps_sysmlv2 import load_architecture")
+    assert "pycps_sysmlv2.parsing" in loaded
+    assert not loaded & {"pycps_sysmlv2.validation", "pycps_sysmlv2.query", "json"}
+
+
+def test_lazy_exports_resolve_to_submodule_objects():
+    from pycps_sysmlv2 import parsing
+
+    assert pycps_sysmlv2.load_architecture is parsing.load_architecture
+    import pycps_sysmlv2.query as query_module
+
+    assert pycps_sysmlv2.compile_query is query_module.compile_query
+    assert set(pycps_sysmlv2.__all__) <= set(dir(pycps_sysmlv2))
+    try:
+        pycps_sysmlv2.does_not_exist
+    except AttributeError as exc:
+        assert "does_not_exist" in str(exc)
+    else:
+        raise AssertionError("expected AttributeError")
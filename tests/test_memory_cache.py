@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import load_architecture, load_system
+from pycps_sysmlv2.cache import cache_info, clear_cache, configure_cache
+
+
+def _write_model(folder: Path, part: str) -> Path:
+    folder.mkdir(exist_ok=True)
+    path = folder / "model.sysml"
+    path.write_text(f"package P {{\n  part def {part} {{}}\n}}\n")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    configure_cache(maxsize=32, max_bytes=None)
+    clear_cache()
+    yield
+    configure_cache(maxsize=32, max_bytes=None)
+    clear_cache()
+
+
+def test_repeated_loads_return_cached_graph(tmp_path: Path):
+    path = _write_model(tmp_path, "A")
+
+    first = load_architecture(tmp_path, cache=True)
+    assert load_architecture(path, cache=True) is first
+    assert load_system(tmp_path, "A", cache=True) is first.part_definitions["A"]
+    assert load_architecture(tmp_path) is not first
+
+    info = cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+    assert info.bytes == path.stat().st_size
+
+
+def test_changed_files_invalidate_entry(tmp_path: Path):
+    path = _write_model(tmp_path, "A")
+    first = load_architecture(tmp_path, cache=True)
+
+    path.write_text("package P {\n  part def B {}\n}\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = load_architecture(tmp_path, cache=True)
+    assert second is not first
+    assert set(second.part_definitions) == {"B"}
+    assert cache_info().misses == 2
+
+
+def test_lru_evicts_by_count_and_memory_budget(tmp_path: Path):
+    configure_cache(maxsize=2)
+    folders = [tmp_path / name for name in ("a", "b", "c")]
+    for folder in folders:
+        _write_model(folder, "A")
+        load_architecture(folder, cache=True)
+
+    info = cache_info()
+    assert (info.currsize, info.evictions) == (2, 1)
+    load_architecture(folders[2], cache=True)
+    assert cache_info().hits == 1
+
+    size = (folders[0] / "model.sysml").stat().st_size
+    configure_cache(maxsize=2, max_bytes=size)
+    info = cache_info()
+    assert (info.currsize, info.evictions, info.bytes) == (1, 2, size)
+
+    configure_cache(maxsize=64)  # keeps the memory budget
+    assert (cache_info().maxsize, cache_info().max_bytes) == (64, size)
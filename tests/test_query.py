@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import compile_query, load_architecture
+from pycps_sysmlv2.definitions import PrimitiveType
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+
+
+@pytest.fixture(scope="module")
+def architecture():
+    return load_architecture(FIXTURE_ARCH_DIR)
+
+
+def _nested_loop_real_out_attributes(architecture):
+    composition = architecture.part_definitions["AircraftComposition"]
+    found = []
+    for subpart in composition.parts.values():
+        for port in subpart.part_def.ports.values():
+            if port.direction != "out":
+                continue
+            for attr in port.port_def.attributes.values():
+                if attr.type.primitive_type() == PrimitiveType.Real:
+                    found.append(attr)
+    return found
+
+
+def test_query_matches_nested_loop_equivalent(architecture):
+    result = list(architecture.query("AircraftComposition/*/out:*/@[type=Real]"))
+    assert result == _nested_loop_real_out_attributes(architecture)
+    assert len(result) > 0
+
+
+def test_query_selects_parts_ports_and_part_attributes(architecture):
+    subparts = list(architecture.query("AircraftComposition/*[type=Environment]"))
+    assert [ref.name for ref in subparts] == ["environment"]
+
+    ports = list(architecture.query("AutopilotModule/in:current*"))
+    assert [port.name for port in ports] == ["currentLocation", "currentOrientation"]
+
+    attrs = list(architecture.query("AutopilotModule/@waypoint*"))
+    assert [attr.name for attr in attrs] == ["waypointCount", "waypointX_km"]
+
+
+def test_query_results_are_lazy_and_compiled_queries_are_cached(architecture):
+    compiled = compile_query("*/port:*")
+    assert compile_query("*/port:*") is compiled
+
+    results = compiled.execute(architecture)
+    assert next(results).name == "feedbackBus"
+
+
+def test_query_with_missing_literal_name_is_empty(architecture):
+    assert list(architecture.query("Missing/*")) == []
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "",
+        "AircraftComposition//autopilot",
+        "@x",
+        "AutopilotModule/@x/y",
+        "AutopilotModule/out:x/y",
+        "AutopilotModule/@[direction=in]",
+    ],
+)
+def test_malformed_queries_raise_value_error(expression):
+    with pytest.raises(ValueError):
+        compile_query(expression)
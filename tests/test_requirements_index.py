@@ -0,0 +1,120 @@
+from pathlib import Path
+
+from pycps_sysmlv2 import load_architecture
+from pycps_sysmlv2.cache import ArchitectureDiskCache
+from pycps_sysmlv2.definitions import (
+    SysMLArchitecture,
+    SysMLPartDefinition,
+    SysMLRequirement,
+)
+from pycps_sysmlv2.events import iter_events
+from pycps_sysmlv2.parser_utils import json_dumps
+from pycps_sysmlv2.requirements import SysMLRequirementIndex
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+
+
+def _write(path: Path, content: str) -> None:
+    path.write_text(content.strip() + "\n")
+
+
+SCOPED_MODEL = """
+package Example {
+  comment REQ_System /* The system shall log every sample. */
+
+  part def Sensor {
+    comment REQ_Sensor_Rate /* The sensor shall sample at 10 Hz. */
+    attribute rate = 10;
+  }
+
+  part def Logger {}
+}
+"""
+
+
+def test_lookup_and_keyword_search_on_fixture():
+    architecture = load_architecture(FIXTURE_ARCH_DIR)
+    index = architecture.requirement_index()
+
+    assert architecture.requirement_index() is index
+    assert len(index) == 2
+    assert index["Requirement_REQ_Waypoints_1"].text.startswith("It should support")
+    assert index.get("Missing") is None
+
+    assert [r.identifier for r in index.search("autopilot hold")] == [
+        "Requirement_REQ_Control"
+    ]
+    assert [r.identifier for r in index.search("WAYPOINT*")] == [
+        "Requirement_REQ_Waypoints_1"
+    ]
+    assert len(index.search("req_*")) == 2
+    assert index.search("autopilot waypoints") == []
+
+
+def test_requirements_link_to_definitions_in_their_scope(tmp_path: Path):
+    _write(tmp_path / "model.sysml", SCOPED_MODEL)
+    for index in (
+        load_architecture(tmp_path).requirement_index(),
+        SysMLRequirementIndex.from_events(iter_events(tmp_path)),
+    ):
+        assert index.scope_of("REQ_Sensor_Rate") == "Sensor"
+        assert index.definitions_for("REQ_Sensor_Rate") == ["Sensor"]
+        assert index.scope_of("REQ_System") is None
+        assert set(index.definitions_for("REQ_System")) == {"Sensor", "Logger"}
+        assert [r.identifier for r in index.requirements_for("Logger")] == ["REQ_System"]
+        assert {r.identifier for r in index.requirements_for("Sensor")} == {
+            "REQ_System",
+            "REQ_Sensor_Rate",
+        }
+
+
+def test_index_updates_incrementally():
+    index = SysMLRequirementIndex()
+    index.add(SysMLRequirement("R1", "Brake within two seconds."))
+    assert [r.identifier for r in index.search("brake")] == ["R1"]
+
+    index.add(SysMLRequirement("R1", "Steer within one second."))
+    assert index.search("brake") == []
+    assert [r.identifier for r in index.search("ste*")] == ["R1"]
+
+    index.remove("R1")
+    assert len(index) == 0 and index.search("ste*") == []
+
+
+def test_index_is_cached_with_parse_results_but_not_exported(tmp_path: Path):
+    architecture = load_architecture(FIXTURE_ARCH_DIR)
+    before = json_dumps(architecture, [])
+    cache = ArchitectureDiskCache(tmp_path)
+    cache.store(FIXTURE_ARCH_DIR, architecture)
+
+    assert json_dumps(architecture, []) == before
+    restored = cache.load(FIXTURE_ARCH_DIR)
+    assert "_requirement_index" in vars(restored)
+    assert len(restored.requirement_index().search("waypoint*")) == 1
+
+
+def test_scopes_are_a_constructor_field_and_lookups_keep_insertion_order():
+    scopes = {"R2": "Sensor"}
+    architecture = SysMLArchitecture(
+        package="Example",
+        part_definitions={"Sensor": SysMLPartDefinition("Sensor")},
+        requirements=[SysMLRequirement(f"R{i}", f"Requirement {i}.") for i in range(1, 4)],
+        _requirement_scopes=scopes,
+    )
+    assert architecture == SysMLArchitecture(
+        package="Example",
+        part_definitions={"Sensor": SysMLPartDefinition("Sensor")},
+        requirements=[SysMLRequirement(f"R{i}", f"Requirement {i}.") for i in range(1, 4)],
+    )
+    assert "_requirement_scopes" not in json_dumps(architecture, [])
+
+    index = architecture.requirement_index()
+    assert [r.identifier for r in index.requirements_for("Sensor")] == ["R1", "R2", "R3"]
+    assert index.requirements_for("Unknown") == []
+
+    index.add(SysMLRequirement("R1", "Moved."), "Sensor")
+    index.remove("R2")
+    assert [r.identifier for r in index.requirements_for("Sensor")] == ["R3", "R1"]
+    assert [r.identifier for r in index.search("r*")] == ["R3", "R1"]
+    assert index.definitions_for("R3") == ["Sensor"]
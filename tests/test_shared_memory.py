@@ -0,0 +1,132 @@
+import math
+import pickle
+import subprocess
+import sys
+from multiprocessing import get_context
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import compile_query, load_architecture
+from pycps_sysmlv2.shared import attach_architecture, share_architecture
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+
+
+def _connection_summary(name: str):
+    with attach_architecture(name) as architecture:
+        composition = architecture.part_definitions["AircraftComposition"]
+        return [
+            (c.src_part_def.name, c.src_port_def.name, c.dst_part_def.name)
+            for c in composition.connections
+        ]
+
+
+@pytest.fixture
+def architecture():
+    return load_architecture(FIXTURE_ARCH_DIR)
+
+
+def test_attached_view_matches_parsed_architecture(architecture):
+    with share_architecture(architecture) as shared, shared.attach() as view:
+        assert view.package == architecture.package
+        assert list(view.part_definitions) == list(architecture.part_definitions)
+        assert list(view.port_definitions) == list(architecture.port_definitions)
+        assert [r.identifier for r in view.requirements] == [
+            r.identifier for r in architecture.requirements
+        ]
+
+        autopilot = view.part_definitions["AutopilotModule"]
+        original = architecture.part_definitions["AutopilotModule"]
+        assert autopilot.doc == original.doc
+        assert autopilot.attributes["waypointX_km"].value == [0.0, 10.0, 20.0]
+        assert autopilot.attributes["waypointX_km"].type.as_string() == "List[Real]"
+        assert autopilot.ports["feedbackBus"].port_def.name == "FlightStatusPacket"
+        assert [
+            (port.name, attr.name, attr.type.as_string())
+            for port, _, attr in autopilot.get_port_attributes()
+        ] == [
+            (port.name, attr.name, attr.type.as_string())
+            for port, _, attr in original.get_port_attributes()
+        ]
+
+        composition = view.part_definitions["AircraftComposition"]
+        assert composition.parts["autopilot"].part_def is autopilot
+        assert composition.connections[0].src_part_def is autopilot
+
+
+def test_views_are_read_only(architecture):
+    with share_architecture(architecture) as shared, shared.attach() as view:
+        part = view.part_definitions["AutopilotModule"]
+        with pytest.raises(AttributeError):
+            part.name = "Other"
+        with pytest.raises(TypeError):
+            part.attributes["x"] = None
+
+
+def test_workers_attach_by_name(architecture):
+    expected = [
+        (c.src_part_def.name, c.src_port_def.name, c.dst_part_def.name)
+        for c in architecture.part_definitions["AircraftComposition"].connections
+    ]
+    with share_architecture(architecture) as shared:
+        assert len(pickle.dumps(shared)) < 200
+        with get_context("spawn").Pool(2) as pool:
+            results = pool.map(_connection_summary, [shared.name] * 2)
+    assert results == [expected, expected]
+
+
+def test_non_finite_values_and_queries_work_on_views(tmp_path: Path):
+    (tmp_path / "model.sysml").write_text(
+        """
+package Example {
+  port def Signal {
+    attribute value : Real;
+  }
+  part def Sensor {
+    attribute limit = 1e999;
+    attribute bounds = [-1e999, 0.5];
+    out port output : Signal;
+  }
+  part def System {
+    part sensor : Sensor;
+  }
+}
+"""
+    )
+    architecture = load_architecture(tmp_path)
+    expression = "System/sensor/out:*[type=Signal]/@[type=Real]"
+    expected = [attr.name for attr in compile_query(expression).execute(architecture)]
+    assert expected == ["value"]
+
+    with share_architecture(architecture) as shared, shared.attach() as view:
+        sensor = view.part_definitions["Sensor"]
+        assert sensor.attributes["limit"].value == math.inf
+        assert sensor.attributes["bounds"].value == [-math.inf, 0.5]
+        assert [attr.name for attr in compile_query(expression).execute(view)] == expected
+        assert [p.name for p in compile_query("System/*[type=Sensor]").execute(view)] == [
+            "sensor"
+        ]
+
+
+def test_independent_process_attaching_does_not_unlink_the_block(architecture):
+    src_dir = Path(__file__).resolve().parents[1] / "src"
+    script = (
+        "import sys\n"
+        "from pycps_sysmlv2.shared import attach_architecture\n"
+        "with attach_architecture(sys.argv[1]) as view:\n"
+        "    print(view.package)\n"
+    )
+    with share_architecture(architecture) as shared:
+        completed = subprocess.run(
+            [sys.executable, "-c", script, shared.name],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=src_dir,
+        )
+        assert completed.stdout.strip() == "Aircraft"
+        assert "leaked" not in completed.stderr
+        with shared.attach() as view:
+            assert view.package == "Aircraft"
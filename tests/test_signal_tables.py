@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import SysMLAttribute, SysMLPortDefinition, SysMLType, load_architecture
+from pycps_sysmlv2.signals import (
+    SIGNAL_COLUMNS,
+    SignalTableBuilder,
+    iter_signal_rows,
+    signal_columns,
+    write_signal_table,
+)
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+
+
+@pytest.fixture(scope="module")
+def composition():
+    return load_architecture(FIXTURE_ARCH_DIR).part_definitions["AircraftComposition"]
+
+
+def _nested_loop_rows(part):
+    rows = []
+    for c in part.connections:
+        for attr in c.src_port_def.attributes.values():
+            rows.append(
+                (
+                    part.name,
+                    c.src_component,
+                    c.src_port,
+                    c.dst_component,
+                    c.dst_port,
+                    c.src_port_def.name,
+                    attr.name,
+                    attr.type.as_string(),
+                )
+            )
+    return rows
+
+
+def test_rows_match_nested_loops(composition):
+    rows = list(iter_signal_rows(composition))
+    assert rows == _nested_loop_rows(composition)
+    assert len(rows) == 15
+
+
+def test_csv_and_jsonl_writers_stream_the_same_rows(composition):
+    expected = _nested_loop_rows(composition)
+
+    buffer = io.StringIO(newline="")
+    assert write_signal_table(composition, buffer, format="csv") == len(expected)
+    parsed = list(csv.reader(io.StringIO(buffer.getvalue())))
+    assert tuple(parsed[0]) == SIGNAL_COLUMNS
+    assert [tuple(row) for row in parsed[1:]] == expected
+
+    buffer = io.StringIO()
+    assert write_signal_table(composition, buffer, format="jsonl") == len(expected)
+    records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert [tuple(record[name] for name in SIGNAL_COLUMNS) for record in records] == expected
+
+    with pytest.raises(ValueError, match="Unsupported signal table format"):
+        write_signal_table(composition, buffer, format="xml")
+
+
+def test_columnar_output_and_layout_reuse(composition):
+    expected = _nested_loop_rows(composition)
+    columns = signal_columns(composition)
+    assert list(zip(*(columns[name] for name in SIGNAL_COLUMNS))) == expected
+
+    builder = SignalTableBuilder()
+    list(builder.iter_rows(composition))
+    port_defs = {id(c.src_port_def) for c in composition.connections}
+    assert len(builder._layouts) == len(port_defs) < len(composition.connections)
+
+
+def test_custom_types_keep_their_names_and_layouts_pin_port_definitions():
+    port_def = SysMLPortDefinition(
+        "Motion",
+        attributes={
+            "speed": SysMLAttribute("speed", SysMLType.from_string("Speed"), None, None),
+            "count": SysMLAttribute("count", SysMLType.from_string("Integer"), None, None),
+        },
+    )
+    builder = SignalTableBuilder()
+    layout = builder.layout(port_def)
+    assert layout.rows == [("speed", "Speed"), ("count", "Integer")]
+    # The cached layout holds its port definition, so the id key cannot be recycled.
+    assert builder._layouts[id(port_def)].port_def is port_def
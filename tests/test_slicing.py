@@ -0,0 +1,82 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import SysMLPartDefinition, load_architecture
+from pycps_sysmlv2.parser_utils import json_dumps
+
+
+MODEL = """
+package Plant {
+  comment REQ_Global /* Every system shall report health. */
+
+  port def Power {
+    attribute watts : Real;
+  }
+  port def Coolant {
+    attribute flow : Real;
+  }
+
+  part def Battery {
+    comment REQ_Battery /* The battery shall supply 5 kW. */
+    out port power : Power;
+  }
+  part def Motor {
+    in port power : Power;
+  }
+  part def Drive {
+    part battery : Battery;
+    part motor : Motor;
+    connect battery.power to motor.power;
+  }
+  part def Pump {
+    comment REQ_Pump /* The pump shall move 2 l/s. */
+    out port coolant : Coolant;
+  }
+  part def CoolingLoop {
+    part pump : Pump;
+    part motor : Motor;
+  }
+}
+"""
+
+
+@pytest.fixture
+def architecture(tmp_path: Path):
+    (tmp_path / "plant.sysml").write_text(MODEL)
+    return load_architecture(tmp_path)
+
+
+def test_slice_keeps_only_reachable_definitions(architecture):
+    drive = architecture.slice("Drive")
+
+    assert list(drive.part_definitions) == ["Battery", "Motor", "Drive"]
+    assert list(drive.port_definitions) == ["Power"]
+    assert [r.identifier for r in drive.requirements] == ["REQ_Global", "REQ_Battery"]
+    assert drive.requirement_index().scope_of("REQ_Battery") == "Battery"
+
+    # Objects are shared, not copied.
+    assert drive.part_definitions["Drive"] is architecture.part_definitions["Drive"]
+    assert drive.port_definitions["Power"] is architecture.port_definitions["Power"]
+    assert drive.part_definitions["Drive"].connections[0].src_port_def is drive.port_definitions["Power"]
+
+    cooling = architecture.slice(architecture.part_definitions["CoolingLoop"])
+    assert set(cooling.part_definitions) == {"Pump", "Motor", "CoolingLoop"}
+    assert set(cooling.port_definitions) == {"Power", "Coolant"}
+    assert {r.identifier for r in cooling.requirements} == {"REQ_Global", "REQ_Pump"}
+
+
+def test_slice_is_self_contained_and_small(architecture):
+    drive = architecture.slice("Drive")
+    restored = pickle.loads(pickle.dumps(drive))
+    assert json_dumps(restored, []) == json_dumps(drive, [])
+    assert len(pickle.dumps(drive)) < len(pickle.dumps(architecture))
+    assert '"name": "Pump"' not in json_dumps(drive, [])
+
+
+def test_slice_rejects_unknown_parts(architecture):
+    with pytest.raises(KeyError, match="Part not found: Missing"):
+        architecture.slice("Missing")
+    with pytest.raises(KeyError, match="Part not found: Drive"):
+        architecture.slice(SysMLPartDefinition("Drive"))
@@ -0,0 +1,101 @@
+import pytest
+
+from pycps_sysmlv2 import (
+    SysMLArchitecture,
+    SysMLPartDefinition,
+    SysMLPartReference,
+    SysMLRequirement,
+    SysMLType,
+)
+from pycps_sysmlv2.parser_utils import to_jsonable
+from pycps_sysmlv2.traversal import iter_part_instances, walk, walk_model, walk_parts
+from pycps_sysmlv2.utils import obj_base
+
+
+def _chain(depth: int) -> SysMLArchitecture:
+    part_defs = {}
+    child = None
+    for level in reversed(range(depth)):
+        parts = {}
+        if child is not None:
+            parts["child"] = SysMLPartReference("child", child.name, part_def=child)
+        child = SysMLPartDefinition(f"Level{level}", parts=parts)
+        part_defs[child.name] = child
+    return SysMLArchitecture(package="Deep", part_definitions=part_defs)
+
+
+def test_walk_orders_and_cycles():
+    graph = {"a": ["b", "c"], "b": ["d"], "c": ["d", "a"], "d": []}
+    assert list(walk("a", graph.__getitem__)) == ["a", "b", "d", "c"]
+    assert list(walk("a", graph.__getitem__, order="post")) == ["d", "b", "c", "a"]
+    with pytest.raises(ValueError, match="Unsupported traversal order"):
+        list(walk("a", graph.__getitem__, order="level"))
+
+
+def test_part_walkers_handle_shared_and_recursive_definitions():
+    leaf = SysMLPartDefinition("Leaf")
+    loop = SysMLPartDefinition("Loop")
+    root = SysMLPartDefinition(
+        "Root",
+        parts={
+            "left": SysMLPartReference("left", "Leaf", part_def=leaf),
+            "right": SysMLPartReference("right", "Leaf", part_def=leaf),
+            "loop": SysMLPartReference("loop", "Loop", part_def=loop),
+        },
+    )
+    loop.parts["back"] = SysMLPartReference("back", "Root", part_def=root)
+
+    assert [p.name for p in walk_parts(root)] == ["Root", "Leaf", "Loop"]
+    assert [p.name for p in walk_parts(root, "post")] == ["Leaf", "Loop", "Root"]
+    assert [(path, p.name) for path, p in iter_part_instances(root)] == [
+        ((), "Root"),
+        (("left",), "Leaf"),
+        (("right",), "Leaf"),
+        (("loop",), "Loop"),
+    ]
+    assert len(list(walk_model(root))) == 7  # 3 definitions + 4 references
+
+
+def test_to_jsonable_keeps_suppress_list_semantics():
+    first = SysMLRequirement("R1", "Same text.")
+    duplicate = SysMLRequirement("R1", "Same text.")
+    suppress = []
+    exported = to_jsonable({"a": first, "b": duplicate, "c": [first]}, suppress)
+    assert exported == {
+        "a": {"identifier": "R1", "text": "Same text."},
+        "b": "__ref__",  # equal dataclasses are suppressed, as with `in` on a list
+        "c": ["__ref__"],
+    }
+    assert suppress == [first]
+
+    part = SysMLPartDefinition("Self")
+    part.parts["me"] = SysMLPartReference("me", "Self", part_def=part)
+    assert to_jsonable(part, [])["parts"]["me"]["part_def"] == "__ref__"
+    with pytest.raises(ValueError, match="Circular reference"):
+        to_jsonable(part, None)
+
+
+def test_depth_ten_thousand_models_do_not_recurse():
+    depth = 10_000
+    architecture = _chain(depth)
+    root = architecture.part_definitions["Level0"]
+
+    assert next(walk_parts(root, "post")).name == f"Level{depth - 1}"
+    path, deepest = list(iter_part_instances(root))[-1]
+    assert len(path) == depth - 1 and deepest.name == f"Level{depth - 1}"
+
+    exported = to_jsonable(architecture, [])
+    node = exported["part_definitions"]["Level0"]
+    levels = 0
+    while node != "__ref__":  # the leaf was exported first (sorted by part count)
+        node = node["parts"]["child"]["part_def"]
+        levels += 1
+    assert levels == depth - 1
+
+    nested = 1
+    for _ in range(depth):
+        nested = [nested]
+    nested_type = SysMLType.from_value(nested)
+    assert nested_type.as_string() == "List[" * depth + "Integer" + "]" * depth
+    assert nested_type.primitive_type_str() == "Integer"
+    assert obj_base(nested) == 1
@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import load_architecture, validate_connections
+from pycps_sysmlv2.validation import ConnectionChecker
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+
+
+def _write(path: Path, content: str) -> None:
+    path.write_text(content.strip() + "\n")
+
+
+MISMATCHED_MODEL = """
+package Example {
+  port def Speed {
+    attribute value: Real;
+  }
+
+  port def Count {
+    attribute value: Integer;
+  }
+
+  part def Sensor {
+    out port speed : Speed;
+    in port count : Count;
+  }
+
+  part def Logger {
+    in port speed : Count;
+    out port count : Count;
+  }
+
+  part def System {
+    part sensor : Sensor;
+    part logger : Logger;
+    connect sensor.speed to logger.speed;
+    connect logger.count to sensor.count;
+    connect sensor.count to logger.count;
+  }
+}
+"""
+
+
+def test_fixture_connections_are_compatible():
+    architecture = load_architecture(FIXTURE_ARCH_DIR, validate=True)
+    assert validate_connections(architecture) == []
+
+
+def test_validate_connections_reports_all_mismatches(tmp_path: Path):
+    _write(tmp_path / "model.sysml", MISMATCHED_MODEL)
+    issues = validate_connections(load_architecture(tmp_path))
+
+    assert [(issue.kind, issue.connection.src_port) for issue in issues] == [
+        ("type", "speed"),
+        ("direction", "count"),
+        ("direction", "count"),
+    ]
+    assert "value (Real vs Integer)" in issues[0].message
+
+
+def test_validate_flag_raises_with_every_issue(tmp_path: Path):
+    _write(tmp_path / "model.sysml", MISMATCHED_MODEL)
+    with pytest.raises(ValueError, match="3 incompatible connection"):
+        load_architecture(tmp_path, validate=True)
+
+
+def test_checker_caches_signatures_per_port_definition():
+    architecture = load_architecture(FIXTURE_ARCH_DIR)
+    checker = ConnectionChecker()
+    checker.check(architecture.part_definitions.values())
+    connections = architecture.part_definitions["AircraftComposition"].connections
+    pairs = {(id(c.src_port_def), id(c.dst_port_def)) for c in connections}
+    assert len(checker._verdicts) == len(pairs)
+    # Entries hold the port definitions, so their ids cannot be recycled meanwhile.
+    c = connections[0]
+    src, dst, _ = checker._verdicts[id(c.src_port_def), id(c.dst_port_def)]
+    assert src is c.src_port_def and dst is c.dst_port_def
+    checker.signature(c.src_port_def)
+    assert checker._signatures[id(c.src_port_def)][0] is c.src_port_def
+
+
+def test_custom_payload_types_are_compared_by_name(tmp_path: Path):
+    _write(
+        tmp_path / "model.sysml",
+        """
+package Example {
+  port def A {
+    attribute v: Speed;
+  }
+  port def B {
+    attribute v: Mass;
+  }
+  port def C {
+    attribute v: Speed;
+  }
+  part def Source {
+    out port o : A;
+  }
+  part def Sink {
+    in port i : B;
+    in port j : C;
+  }
+  part def System {
+    part source : Source;
+    part sink : Sink;
+    connect source.o to sink.i;
+    connect source.o to sink.j;
+  }
+}
+""",
+    )
+    issues = validate_connections(load_architecture(tmp_path))
+    assert [issue.connection.dst_port for issue in issues] == ["i"]
+    assert "v (Speed vs Mass)" in issues[0].message
+    with pytest.raises(ValueError, match="1 incompatible connection"):
+        load_architecture(tmp_path, validate=True)
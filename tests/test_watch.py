@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2.watch import SysMLFolderWatcher
+
+
+PORTS = """
+package Example {
+  port def Signal {
+    attribute value : Real;
+  }
+}
+"""
+
+PARTS = """
+package Example {
+  part def Sensor {
+    out port output : Signal;
+  }
+  part def Logger {
+    in port input : Signal;
+  }
+  part def System {
+    part sensor : Sensor;
+    part logger : Logger;
+    connect sensor.output to logger.input;
+  }
+}
+"""
+
+
+def _write(path: Path, content: str) -> None:
+    # Bump the mtime explicitly so back-to-back writes are always distinguishable.
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content.strip() + "\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, max(stat.st_mtime_ns, mtime + 1_000_000)))
+
+
+@pytest.fixture
+def model(tmp_path: Path) -> Path:
+    _write(tmp_path / "ports.sysml", PORTS)
+    _write(tmp_path / "parts.sysml", PARTS)
+    return tmp_path
+
+
+def test_poll_reloads_only_changed_files(model: Path):
+    watcher = SysMLFolderWatcher(model)
+    changes = []
+    watcher.subscribe(changes.append)
+    signal = watcher.architecture.port_definitions["Signal"]
+    assert watcher.poll() is None
+
+    edited = PARTS.replace("part def Logger {", "part def Logger {\n    attribute rate = 10;")
+    _write(model / "parts.sysml", edited)
+    change = watcher.poll()
+    assert changes == [change]
+    assert change.modified == {model / "parts.sysml"} and not change.added | change.removed
+    assert change.definitions == {"Logger"}
+    architecture = change.architecture
+    assert architecture is watcher.architecture
+    assert architecture.port_definitions["Signal"] is signal
+    assert architecture.part_definitions["System"].connections[0].dst_port_def is signal
+    assert "rate" in architecture.part_definitions["Logger"].attributes
+
+    _write(model / "extra.sysml", "package Example {\n  part def Extra {}\n}")
+    change = watcher.poll()
+    assert change.added == {model / "extra.sysml"} and change.definitions == {"Extra"}
+
+    (model / "extra.sysml").unlink()
+    change = watcher.poll()
+    assert change.removed == {model / "extra.sysml"} and change.definitions == {"Extra"}
+    assert "Extra" not in change.architecture.part_definitions
+    assert len(changes) == 3
+
+
+def test_delivered_architectures_are_not_relinked(model: Path):
+    _write(model / "other.sysml", "package Example {\n  part def Other {}\n}")
+    watcher = SysMLFolderWatcher(model)
+    old = watcher.architecture
+    old_signal = old.port_definitions["Signal"]
+
+    _write(model / "ports.sysml", PORTS.replace("value : Real", "level : Integer"))
+    new = watcher.poll().architecture
+
+    sensor = old.part_definitions["Sensor"]
+    assert sensor.ports["output"].port_def is old_signal
+    assert list(old_signal.attributes) == ["value"]
+    assert old.part_definitions["System"].connections[0].src_port_def is old_signal
+    # Dependents got fresh objects; files not referring to a changed definition are kept.
+    assert new.part_definitions["Sensor"] is not sensor
+    assert new.part_definitions["System"].connections[0].src_port_def is (
+        new.port_definitions["Signal"]
+    )
+    assert new.part_definitions["Other"] is old.part_definitions["Other"]
+
+
+def test_failed_reload_keeps_previous_architecture(model: Path):
+    errors = []
+    watcher = SysMLFolderWatcher(model, on_error=errors.append)
+    before = watcher.architecture
+
+    _write(model / "ports.sysml", PORTS.replace("port def Signal", "port def Renamed"))
+    assert watcher.poll() is None
+    assert watcher.architecture is before
+    assert "Port definition not found" in str(watcher.error)
+    assert watcher.poll() is None and len(errors) == 1
+    # The failed relink must not have touched the references the kept graph shares.
+    sensor = before.part_definitions["Sensor"]
+    assert sensor.ports["output"].port_def is before.port_definitions["Signal"]
+    assert [attr.name for _, _, attr in sensor.get_port_attributes()] == ["value"]
+    connection = before.part_definitions["System"].connections[0]
+    assert connection.src_port_def is before.port_definitions["Signal"]
+
+    _write(model / "ports.sysml", PORTS)
+    change = watcher.poll()
+    assert change.definitions == set() and watcher.error is None
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_background_watcher_debounces_bursts(model: Path, use_inotify: bool):
+    watcher = SysMLFolderWatcher(
+        model, debounce=0.3, poll_interval=0.05, use_inotify=use_inotify
+    )
+    changes = []
+    delivered = threading.Event()
+
+    def on_change(change):
+        changes.append(change)
+        delivered.set()
+
+    watcher.subscribe(on_change)
+    with watcher:
+        for rate in range(3):
+            edited = PARTS.replace(
+                "part def Sensor {", f"part def Sensor {{\n    attribute rate = {rate};"
+            )
+            _write(model / "parts.sysml", edited)
+        assert delivered.wait(5)
+        time.sleep(0.5)
+
+    assert len(changes) == 1
+    assert changes[0].definitions == {"Sensor"}
+    assert changes[0].architecture.part_definitions["Sensor"].attributes["rate"].value == 2
@@ -0,0 +1,118 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from pycps_sysmlv2 import (
+    SysMLArchitecture,
+    SysMLAttribute,
+    SysMLPortDefinition,
+    SysMLType,
+    load_architecture,
+)
+from pycps_sysmlv2.parser_utils import json_dumps
+from pycps_sysmlv2.writer import to_sysml, write_architecture, write_sysml
+
+
+FIXTURE_ARCH_DIR = Path(__file__).resolve().parent / "fixtures" / "aircraft_subset"
+
+
+def _write(path: Path, content: str) -> None:
+    path.write_text(content.strip() + "\n")
+
+
+def test_fixture_round_trips_through_single_and_sharded_files(tmp_path: Path):
+    architecture = load_architecture(FIXTURE_ARCH_DIR)
+    expected = json_dumps(architecture, [])
+
+    assert write_architecture(architecture, tmp_path / "single") == [
+        tmp_path / "single" / "Aircraft.sysml"
+    ]
+    assert json_dumps(load_architecture(tmp_path / "single"), []) == expected
+
+    paths = write_architecture(architecture, tmp_path / "sharded", shard_size=4, stem="model")
+    assert [path.name for path in paths] == [
+        "model_0001.sysml",
+        "model_0002.sysml",
+        "model_0003.sysml",
+    ]
+    assert json_dumps(load_architecture(tmp_path / "sharded"), []) == expected
+
+    with pytest.raises(ValueError, match="shard_size must be positive"):
+        write_architecture(architecture, tmp_path / "bad", shard_size=0)
+
+
+def test_docs_literals_and_scoped_requirements_round_trip(tmp_path: Path):
+    _write(
+        tmp_path / "model.sysml",
+        """
+package Example {
+  comment REQ_System /* The system shall log every sample. */
+
+  port def Sample {
+    attribute value : Real;
+    attribute label : Sensor_Label;
+    attribute raw;
+  }
+
+  part def Sensor {
+    part probe : Probe;
+    doc /* Sampling rate in Hz. */
+    attribute rate = 10;
+    attribute enabled = true;
+    attribute gains = [[0.5, 1.0], [2.0]];
+    attribute name = "front sensor";
+    doc /* Samples out. */
+    out port output : Sample;
+    comment REQ_Sensor_Rate /* The sensor shall   sample at 10 Hz. */
+  }
+
+  part def Probe {}
+}
+""",
+    )
+    architecture = load_architecture(tmp_path)
+    text = to_sysml(architecture)
+    assert "attribute enabled = true;" in text
+    assert "attribute label : Sensor_Label;" in text
+    # The undocumented `part probe` leads so the attribute doc is not taken as the
+    # definition doc.
+    assert text.index("part probe") < text.index("doc /* Sampling rate")
+
+    write_architecture(architecture, tmp_path / "out")
+    reparsed = load_architecture(tmp_path / "out")
+    assert json_dumps(reparsed, []) == json_dumps(architecture, [])
+    assert reparsed.part_definitions["Sensor"].attributes["rate"].doc == "Sampling rate in Hz."
+    assert reparsed.part_definitions["Sensor"].doc is None
+    index = reparsed.requirement_index()
+    assert index.scope_of("REQ_Sensor_Rate") == "Sensor"
+    assert index.scope_of("REQ_System") is None
+
+
+def test_unrepresentable_values_are_rejected():
+    port = SysMLPortDefinition(
+        "P", attributes={"a": SysMLAttribute("a", SysMLType.from_value("{x}"), "{x}", None)}
+    )
+    with pytest.raises(ValueError, match="contains braces or comments"):
+        to_sysml(SysMLArchitecture("Example", port_definitions={"P": port}))
+
+    port.attributes["a"] = SysMLAttribute("a", None, None, "documented")
+    with pytest.raises(ValueError, match="first member is documented"):
+        to_sysml(SysMLArchitecture("Example", port_definitions={"P": port}))
+
+
+def test_large_models_stream_in_linear_time():
+    count = 100_000
+    port_defs = {
+        f"P{i}": SysMLPortDefinition(
+            f"P{i}",
+            doc=f"Signal {i}.",
+            attributes={"value": SysMLAttribute("value", SysMLType.from_value(i), i, None)},
+        )
+        for i in range(count)
+    }
+    buffer = io.StringIO()
+    write_sysml(SysMLArchitecture("Big", port_definitions=port_defs), buffer)
+    text = buffer.getvalue()
+    assert text.count("  port def ") == count
+    assert text.rstrip().endswith("attribute value = 99999;\n  }\n}")